@@ -1,14 +1,2176 @@
-import networkx as nx
-import matplotlib.pyplot as plt
+import numpy as np
+import argparse
+import hashlib
+import heapq
+import itertools
+import math
+import os
 import random
-from collections import defaultdict
+import sys
+from array import array
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+
+
+class GrafKompak:
+
+    def __init__(self, jumlah_simpul=0, label=None):
+        self.jumlah_simpul = jumlah_simpul
+        self.label = label
+        self._u = np.empty(0, dtype=np.int32)
+        self._v = np.empty(0, dtype=np.int32)
+        self._m = 0
+        self._csr = None
+
+    def __len__(self):
+        return self.jumlah_simpul
+
+    @property
+    def jumlah_sisi(self):
+        return self._m
+
+    @property
+    def u(self):
+        return self._kolom(self._u)
+
+    @property
+    def v(self):
+        return self._kolom(self._v)
+
+    def _kolom(self, kolom):
+        tampak = kolom[:self._m]
+        tampak.setflags(write=False)
+        return tampak
+
+    def _sediakan(self, tambahan):
+        perlu = self._m + tambahan
+        if perlu <= len(self._u):
+            return
+        kapasitas = max(perlu, 2 * len(self._u), 16) if self._m else perlu
+        for nama in ("_u", "_v"):
+            kolom = np.empty(kapasitas, dtype=np.int32)
+            kolom[:self._m] = getattr(self, nama)[:self._m]
+            setattr(self, nama, kolom)
+
+    def tambah_sisi(self, u, v):
+        self._sediakan(1)
+        self._u[self._m] = u
+        self._v[self._m] = v
+        self._m += 1
+        self._csr = None
+
+    def tambah_sisi_banyak(self, edges):
+        edges = np.asarray(edges, dtype=np.int32).reshape(-1, 2)
+        self._sediakan(len(edges))
+        self._u[self._m:self._m + len(edges)] = edges[:, 0]
+        self._v[self._m:self._m + len(edges)] = edges[:, 1]
+        self._m += len(edges)
+        self._csr = None
+
+    def sisi(self):
+        return np.column_stack((self.u, self.v))
+
+    def derajat(self):
+        n = self.jumlah_simpul
+        return np.bincount(self.u, minlength=n) + np.bincount(self.v, minlength=n)
+
+    def csr(self):
+        if self._csr is None:
+            asal = np.concatenate((self.u, self.v))
+            tujuan = np.concatenate((self.v, self.u))
+            urut = np.argsort(asal, kind='stable')
+            indptr = np.zeros(self.jumlah_simpul + 1, dtype=np.int64)
+            np.cumsum(np.bincount(asal, minlength=self.jumlah_simpul), out=indptr[1:])
+            self._csr = (indptr, tujuan[urut])
+        return self._csr
+
+    def tetangga(self, simpul):
+        indptr, indices = self.csr()
+        return indices[indptr[simpul]:indptr[simpul + 1]]
+
+    def label_simpul(self):
+        if self.label is not None:
+            return self.label
+        return range(1, self.jumlah_simpul + 1)
+
+    def tulis_daftar_sisi(self, berkas, format="tsv", ukuran_blok=1 << 20):
+        if format == "bin":
+            berkas.write(self.sisi().astype('<i4').tobytes())
+            return
+        label = None if self.label is None else np.asarray(self.label)
+        for mulai in range(0, self.jumlah_sisi, ukuran_blok):
+            u = self.u[mulai:mulai + ukuran_blok]
+            v = self.v[mulai:mulai + ukuran_blok]
+            if label is None:
+                u, v = u + 1, v + 1
+            else:
+                u, v = label[u], label[v]
+            berkas.write(''.join(map('{}\t{}\n'.format, u.tolist(), v.tolist())))
+
+    def ringkas(self):
+        n = self.jumlah_simpul
+        a = np.minimum(self.u, self.v).astype(np.int64)
+        b = np.maximum(self.u, self.v).astype(np.int64)
+        bukan_loop = a != b
+        kunci, bobot = np.unique(a[bukan_loop] * n + b[bukan_loop], return_counts=True)
+        return kunci // n, kunci % n, bobot.astype(float)
+
+    def to_networkx(self, pakai_label=True):
+        import networkx as nx
+
+        graf = nx.MultiGraph()
+        label = self.label_simpul() if pakai_label else range(self.jumlah_simpul)
+        graf.add_nodes_from(label)
+        graf.add_edges_from((label[u], label[v]) for u, v in zip(self.u.tolist(), self.v.tolist()))
+        return graf
+
+
+class HistogramDerajat:
+
+    def __init__(self, derajat, jumlah):
+        derajat = np.asarray(derajat, dtype=np.int64)
+        jumlah = np.asarray(jumlah, dtype=np.int64)
+        if (jumlah < 0).any():
+            raise ValueError("Jumlah simpul per kelas derajat tidak boleh negatif.")
+        ada = jumlah > 0
+        derajat, jumlah = derajat[ada], jumlah[ada]
+        gabung = np.ones(len(derajat), dtype=bool)
+        gabung[1:] = derajat[1:] != derajat[:-1]
+        self.derajat = derajat[gabung]
+        self.jumlah = np.add.reduceat(jumlah, np.flatnonzero(gabung)) if len(jumlah) else jumlah
+
+    @classmethod
+    def dari_barisan(cls, derajat):
+        derajat = np.asarray(derajat, dtype=np.int64)
+        return cls(derajat, np.ones(len(derajat), dtype=np.int64))
+
+    def __len__(self):
+        return self.jumlah_simpul
+
+    @property
+    def jumlah_simpul(self):
+        return int(self.jumlah.sum())
+
+    @property
+    def total_derajat(self):
+        return int((self.derajat * self.jumlah).sum())
+
+    def barisan(self):
+        return np.repeat(self.derajat, self.jumlah)
+
+    def kelas(self):
+        nilai, kebalikan = np.unique(self.derajat, return_inverse=True)
+        jumlah = np.bincount(kebalikan, weights=self.jumlah).astype(np.int64)
+        return nilai[::-1], jumlah[::-1]
+
+    def statistik(self):
+        n = self.jumlah_simpul
+        if n == 0:
+            return {"jumlah_simpul": 0, "total_derajat": 0}
+        total = self.total_derajat
+        rata = total / n
+        return {
+            "jumlah_simpul": n,
+            "total_derajat": total,
+            "kelas_derajat": len(self.kelas()[0]),
+            "derajat_min": int(self.derajat.min()),
+            "derajat_maks": int(self.derajat.max()),
+            "rata_rata": rata,
+            "variansi": float((self.jumlah * (self.derajat - rata) ** 2).sum() / n),
+            "simpul_ganjil": int(self.jumlah[self.derajat % 2 == 1].sum()),
+        }
+
+
+def _sebagai_barisan(derajat):
+    if isinstance(derajat, HistogramDerajat):
+        return derajat.barisan()
+    return np.asarray(derajat, dtype=np.int64)
+
+
+def buat_rng(seed=None):
+    if isinstance(seed, np.random.Generator):
+        return seed
+    if isinstance(seed, random.Random):
+        return np.random.default_rng(seed.getrandbits(128))
+    return np.random.default_rng(seed)
+
+
+def _rng_python(seed=None):
+    if isinstance(seed, random.Random):
+        return seed
+    if isinstance(seed, np.random.Generator):
+        return random.Random(int(seed.integers(1 << 63)))
+    return random.Random(seed)
+
+
+def pecah_seed(seed, jumlah):
+    if isinstance(seed, (np.random.Generator, random.Random)):
+        seed = int(buat_rng(seed).integers(1 << 63))
+    return np.random.SeedSequence(seed).spawn(jumlah)
+
+
+_KONSTANTA_HASH = 0x9E3779B97F4A7C15
+
+
+class _TabelPasangan:
+
+    def __init__(self, n, kapasitas=16):
+        self.n = n
+        self._bit = max(4, (2 * kapasitas - 1).bit_length())
+        self._kunci = array('q', [-1]) * (1 << self._bit)
+        self._hitung = array('I', [0]) * (1 << self._bit)
+        self._isi = 0
+
+    @classmethod
+    def dari_sisi(cls, eu, ev, n, hitung_loop=False):
+        a = np.minimum(eu, ev).astype(np.int64)
+        b = np.maximum(eu, ev).astype(np.int64)
+        pilih = slice(None) if hitung_loop else a != b
+        kunci, jumlah = np.unique(a[pilih] * n + b[pilih], return_counts=True)
+        tabel = cls(n, kapasitas=len(kunci))
+        tabel._isi_banyak(kunci, jumlah)
+        return tabel
+
+    def _isi_banyak(self, kunci, jumlah):
+        tabel_kunci = np.frombuffer(self._kunci, dtype=np.int64)
+        tabel_hitung = np.frombuffer(self._hitung, dtype=np.uint32)
+        mask = len(tabel_kunci) - 1
+        slot = ((kunci.astype(np.uint64) * np.uint64(_KONSTANTA_HASH)) >> np.uint64(64 - self._bit)).astype(np.int64)
+        sisa = np.arange(len(kunci))
+        while len(sisa):
+            kosong = tabel_kunci[slot[sisa]] == -1
+            calon = sisa[kosong]
+            _, pertama = np.unique(slot[calon], return_index=True)
+            masuk = calon[pertama]
+            tabel_kunci[slot[masuk]] = kunci[masuk]
+            tabel_hitung[slot[masuk]] = jumlah[masuk]
+            sisa = np.setdiff1d(sisa, masuk, assume_unique=True)
+            slot[sisa] = (slot[sisa] + 1) & mask
+        self._isi += len(kunci)
+
+    def _slot(self, kunci):
+        tabel = self._kunci
+        mask = len(tabel) - 1
+        i = ((kunci * _KONSTANTA_HASH) & 0xFFFFFFFFFFFFFFFF) >> (64 - self._bit)
+        while True:
+            k = tabel[i]
+            if k == kunci or k == -1:
+                return i
+            i = (i + 1) & mask
+
+    def __getitem__(self, kunci):
+        return self._hitung[self._slot(kunci)]
+
+    def __contains__(self, kunci):
+        return self._hitung[self._slot(kunci)] > 0
+
+    def tambah(self, kunci, delta=1):
+        i = self._slot(kunci)
+        if self._kunci[i] == -1:
+            self._kunci[i] = kunci
+            self._isi += 1
+            if 4 * self._isi > 3 * len(self._kunci):
+                self._hitung[i] = delta
+                self._perbesar()
+                return
+        self._hitung[i] += delta
+
+    def _perbesar(self):
+        kunci = np.frombuffer(self._kunci, dtype=np.int64)
+        hitung = np.frombuffer(self._hitung, dtype=np.uint32)
+        hidup = hitung > 0
+        kunci, hitung = kunci[hidup].copy(), hitung[hidup].copy()
+        self.__init__(self.n, kapasitas=2 * len(kunci))
+        self._isi_banyak(kunci, hitung)
+
+    def maks(self):
+        return int(np.frombuffer(self._hitung, dtype=np.uint32).max())
+
+    def salin(self):
+        tabel = _TabelPasangan.__new__(_TabelPasangan)
+        tabel.n = self.n
+        tabel._bit = self._bit
+        tabel._kunci = array('q', self._kunci)
+        tabel._hitung = array('I', self._hitung)
+        tabel._isi = self._isi
+        return tabel
+
+
+def _pasangan_boleh(tabel, u, v, maks_ganda, izinkan_loop):
+    if u == v:
+        return izinkan_loop
+    return tabel is None or tabel[u * tabel.n + v if u < v else v * tabel.n + u] < maks_ganda
+
+
+def _catat_pasangan(tabel, u, v):
+    if tabel is not None and u != v:
+        tabel.tambah(u * tabel.n + v if u < v else v * tabel.n + u)
+
+
+def _sisi_melanggar(edges, n, maks_ganda=2, izinkan_loop=True):
+    a = edges.min(axis=1)
+    b = edges.max(axis=1)
+    loop = a == b
+    if maks_ganda is None:
+        return np.flatnonzero(loop) if not izinkan_loop else np.empty(0, dtype=np.int64)
+    kunci = a * n + b
+    urut = np.argsort(kunci, kind='stable')
+    k = kunci[urut]
+    posisi = np.arange(len(k))
+    awal_grup = np.r_[True, k[1:] != k[:-1]]
+    peringkat = posisi - np.maximum.accumulate(np.where(awal_grup, posisi, 0))
+    melanggar = np.where(loop[urut], not izinkan_loop, peringkat >= maks_ganda)
+    return urut[melanggar]
+
+
+def _pasangkan_stub_numpy(derajat, seed=None, maks_ganda=2, izinkan_loop=True, maks_iterasi=100):
+    rng = buat_rng(seed)
+    derajat = _sebagai_barisan(derajat)
+    n = len(derajat)
+    stubs = np.repeat(np.arange(n, dtype=np.int64), derajat)
+    edges = rng.permutation(stubs).reshape(-1, 2)
+    m = len(edges)
+
+    for _ in range(maks_iterasi):
+        buruk = _sisi_melanggar(edges, n, maks_ganda, izinkan_loop)
+        if not len(buruk):
+            return edges
+        mitra = rng.choice(m, size=min(len(buruk), m), replace=False)
+        idx = np.union1d(buruk, mitra)
+        edges[idx] = rng.permutation(edges[idx].ravel()).reshape(-1, 2)
+
+    return None
+
+
+def _pasangkan_stub(derajat, rng, batas_tolak=32, maks_ganda=2, edge_counts=None, izinkan_loop=True,
+                    batas_pindai=2):
+    n = len(derajat)
+    stubs = array('i')
+    stubs.frombytes(np.repeat(np.arange(n, dtype=np.int32), derajat).tobytes())
+    if maks_ganda is None:
+        edge_counts = None
+    elif edge_counts is None:
+        edge_counts = _TabelPasangan(n, kapasitas=len(stubs) // 2)
+    else:
+        edge_counts = edge_counts.salin()
+    edges = array('i')
+    akhir = len(stubs)
+    sisa_pindai = batas_pindai * akhir
+
+    while akhir > 1:
+        akhir -= 1
+        u = stubs[akhir]
+
+        for _ in range(batas_tolak):
+            j = rng.randrange(akhir)
+            v = stubs[j]
+            if _pasangan_boleh(edge_counts, u, v, maks_ganda, izinkan_loop):
+                break
+        else:
+            mulai = rng.randrange(akhir)
+            for j in itertools.chain(range(mulai, akhir), range(mulai)):
+                sisa_pindai -= 1
+                if sisa_pindai < 0:
+                    return None
+                v = stubs[j]
+                if _pasangan_boleh(edge_counts, u, v, maks_ganda, izinkan_loop):
+                    break
+            else:
+                return None
+
+        akhir -= 1
+        stubs[j] = stubs[akhir]
+        stubs[akhir] = v
+        edges.append(u)
+        edges.append(v)
+        _catat_pasangan(edge_counts, u, v)
+
+    return edges
+
+
+def alasan_tidak_grafis(derajat, maks_ganda=2, izinkan_loop=True):
+    if maks_ganda is not None and maks_ganda < 1:
+        raise ValueError("maks_ganda harus >= 1, atau None untuk tanpa batas.")
+    if not isinstance(derajat, HistogramDerajat):
+        derajat = HistogramDerajat.dari_barisan(derajat)
+    if (derajat.derajat < 0).any():
+        return "Derajat tidak boleh negatif."
+    total = derajat.total_derajat
+    if total % 2 != 0:
+        return "Total derajat ganjil. Tidak bisa buat graf."
+    if izinkan_loop or total == 0:
+        return None
+
+    d, c = derajat.kelas()
+    if maks_ganda is None:
+        if 2 * d[0] > total:
+            return f"Derajat terbesar {d[0]} melebihi jumlah derajat simpul lain tanpa loop."
+        return None
+
+    k = maks_ganda
+    akhir = np.cumsum(c)
+    n = int(akhir[-1])
+    prefix_akhir = np.cumsum(d * c)
+    r = np.unique(np.clip(np.concatenate((
+        akhir, akhir - c + 1,
+        d // k, d // k + 1,
+        (2 * d + k) // (2 * k), (2 * d + k) // (2 * k) + 1,
+    )), 1, n))
+
+    def prefix(x):
+        j = np.searchsorted(akhir, x)
+        sebelum = np.where(j > 0, prefix_akhir[j - 1], 0)
+        awal = np.where(j > 0, akhir[j - 1], 0)
+        return sebelum + d[j] * (x - awal)
+
+    t = np.searchsorted(-d, -k * r, side='right')
+    q = np.where(t > 0, akhir[t - 1], 0)
+    batas = np.maximum(q, r)
+    kiri = prefix(r)
+    kanan = k * r * (r - 1) + k * r * (batas - r) + (total - prefix(batas))
+    gagal = np.flatnonzero(kiri > kanan)
+    if len(gagal):
+        i = gagal[0]
+        return (f"{r[i]} simpul berderajat terbesar butuh {kiri[i]} ujung sisi, "
+                f"tetapi maksimal hanya {kanan[i]} dengan batas {maks_ganda} sisi paralel tanpa loop.")
+    return None
+
+
+def _konstruksi_havel_hakimi(derajat):
+    alasan = alasan_tidak_grafis(derajat, maks_ganda=1, izinkan_loop=False)
+    if alasan is not None:
+        raise ValueError(alasan)
+
+    derajat = [int(d) for d in derajat]
+    ember = [[] for _ in range(max(derajat, default=0) + 1)]
+    for node, deg in enumerate(derajat):
+        if deg > 0:
+            ember[deg].append(node)
+
+    edges = array('i')
+    tertinggi = len(ember) - 1
+    while True:
+        while tertinggi > 0 and not ember[tertinggi]:
+            tertinggi -= 1
+        if tertinggi == 0:
+            return edges
+
+        u = ember[tertinggi].pop()
+        diambil = []
+        k = tertinggi
+        while len(diambil) < tertinggi:
+            while not ember[k]:
+                k -= 1
+            for _ in range(min(tertinggi - len(diambil), len(ember[k]))):
+                diambil.append((ember[k].pop(), k))
+
+        for v, k in diambil:
+            edges.append(u)
+            edges.append(v)
+            if k > 1:
+                ember[k - 1].append(v)
+
+
+def _konstruksi_berbatas(derajat, maks_ganda=2, izinkan_loop=True):
+    alasan = alasan_tidak_grafis(derajat, maks_ganda=maks_ganda, izinkan_loop=izinkan_loop)
+    if alasan is not None:
+        raise ValueError(alasan)
+
+    derajat = [int(d) for d in derajat]
+    edges = array('i')
+    if izinkan_loop and alasan_tidak_grafis(derajat, maks_ganda=maks_ganda, izinkan_loop=False) is not None:
+        ganjil = [node for node, deg in enumerate(derajat) if deg % 2]
+        for u, v in zip(ganjil[::2], ganjil[1::2]):
+            edges.extend((u, v))
+        for node, deg in enumerate(derajat):
+            edges.extend((node, node) * (deg // 2))
+        return edges
+
+    heap = [(-deg, node) for node, deg in enumerate(derajat) if deg > 0]
+    heapq.heapify(heap)
+    while heap:
+        du, u = heapq.heappop(heap)
+        du = -du
+        batas = du if maks_ganda is None else maks_ganda
+        salinan = {}
+        jenuh = []
+        while du:
+            if not heap:
+                raise ValueError("Konstruksi berbatas gagal; derajat tidak dapat dipenuhi.")
+            dv, v = heapq.heappop(heap)
+            edges.extend((u, v))
+            du -= 1
+            dv += 1
+            salinan[v] = salinan.get(v, 0) + 1
+            if dv and salinan[v] < batas:
+                heapq.heappush(heap, (dv, v))
+            elif dv:
+                jenuh.append((dv, v))
+        for item in jenuh:
+            heapq.heappush(heap, item)
+    return edges
+
+
+def _realisasi_awal(derajat, maks_ganda=2, izinkan_loop=True):
+    if alasan_tidak_grafis(derajat, maks_ganda=1, izinkan_loop=False) is None:
+        edges = _konstruksi_havel_hakimi(derajat)
+    else:
+        edges = _konstruksi_berbatas(derajat, maks_ganda=maks_ganda, izinkan_loop=izinkan_loop)
+    graf = GrafKompak(len(derajat))
+    graf.tambah_sisi_banyak(np.frombuffer(edges, dtype=np.int32))
+    return graf
+
+
+def _tukar_sisi(eu, ev, n, rng, jumlah_tukar, maks_ganda=2, izinkan_loop=True):
+    if not izinkan_loop and any(a == b for a, b in zip(eu, ev)):
+        raise ValueError("Realisasi awal memuat loop padahal loop tidak diizinkan.")
+    if maks_ganda is not None and len(_sisi_melanggar(np.column_stack((eu, ev)).reshape(-1, 2), n, maks_ganda)):
+        raise ValueError(f"Realisasi awal melanggar batas {maks_ganda} sisi paralel.")
+
+    kali = _TabelPasangan.dari_sisi(np.asarray(eu), np.asarray(ev), n, hitung_loop=True)
+    m = len(eu)
+    diterima = 0
+    for _ in range(jumlah_tukar if m > 1 else 0):
+        i = rng.randrange(m)
+        j = rng.randrange(m - 1)
+        if j >= i:
+            j += 1
+        a, b = eu[i], ev[i]
+        if rng.random() < 0.5:
+            c, d = eu[j], ev[j]
+        else:
+            d, c = eu[j], ev[j]
+        if not izinkan_loop and (a == d or c == b):
+            continue
+
+        lama = (a * n + b if a < b else b * n + a, c * n + d if c < d else d * n + c)
+        baru = (a * n + d if a < d else d * n + a, c * n + b if c < b else b * n + c)
+        bobot = 2.0 ** ((a == d) + (c == b) - (a == b) - (c == d))
+        for kunci in lama:
+            bobot /= kali[kunci]
+            kali.tambah(kunci, -1)
+        for kunci in baru:
+            kali.tambah(kunci)
+            bobot *= kali[kunci]
+
+        boleh = maks_ganda is None or ((a == d or kali[baru[0]] <= maks_ganda)
+                                       and (c == b or kali[baru[1]] <= maks_ganda))
+        if boleh and (bobot >= 1 or rng.random() < bobot):
+            eu[i], ev[i], eu[j], ev[j] = a, d, c, b
+            diterima += 1
+        else:
+            for kunci in baru:
+                kali.tambah(kunci, -1)
+            for kunci in lama:
+                kali.tambah(kunci)
+    return diterima
+
+
+def tukar_sisi_acak(graf, faktor_campur=10, seed=None, maks_ganda=2, izinkan_loop=True):
+    eu, ev = graf.u.tolist(), graf.v.tolist()
+    _tukar_sisi(eu, ev, graf.jumlah_simpul, _rng_python(seed), faktor_campur * len(eu), maks_ganda, izinkan_loop)
+    hasil = GrafKompak(graf.jumlah_simpul, label=graf.label)
+    hasil.tambah_sisi_banyak(np.column_stack((eu, ev)))
+    return hasil
+
+
+def sampel_tukar_sisi(graf, jumlah_sampel, burn_in=10, jarak=1, seed=None, maks_ganda=2, izinkan_loop=True):
+    rng = _rng_python(seed)
+    n = graf.jumlah_simpul
+    eu, ev = graf.u.tolist(), graf.v.tolist()
+    m = len(eu)
+    _tukar_sisi(eu, ev, n, rng, burn_in * m, maks_ganda, izinkan_loop)
+    for _ in range(jumlah_sampel):
+        sampel = GrafKompak(n, label=graf.label)
+        sampel.tambah_sisi_banyak(np.column_stack((eu, ev)))
+        yield sampel
+        _tukar_sisi(eu, ev, n, rng, jarak * m, maks_ganda, izinkan_loop)
+
+
+class _IndeksKandidat:
+
+    def __init__(self, derajat, batas):
+        self.batas = batas
+        self.anggota = [node for node, deg in enumerate(derajat) if deg >= batas]
+        self.posisi = {node: i for i, node in enumerate(self.anggota)}
+
+    def __len__(self):
+        return len(self.anggota)
+
+    def __contains__(self, node):
+        return node in self.posisi
+
+    def pilih(self, rng):
+        return self.anggota[rng.randrange(len(self.anggota))]
+
+    def perbarui(self, node, deg):
+        if deg >= self.batas or node not in self.posisi:
+            return
+        i = self.posisi.pop(node)
+        terakhir = self.anggota.pop()
+        if terakhir != node:
+            self.anggota[i] = terakhir
+            self.posisi[terakhir] = i
+
+
+def _pilih_pasangan(kandidat, edge_counts, n, rng, batas_tolak=32):
+    if len(kandidat) < 2:
+        return None
+    for _ in range(batas_tolak):
+        u = kandidat.pilih(rng)
+        v = kandidat.pilih(rng)
+        if u != v and (u * n + v if u < v else v * n + u) not in edge_counts:
+            return u, v
+    for i, u in enumerate(kandidat.anggota):
+        for v in kandidat.anggota[i + 1:]:
+            if (u * n + v if u < v else v * n + u) not in edge_counts:
+                return u, v
+    return None
+
+
+def _tempatkan_syarat(derajat, jumlah_loop, jumlah_ganda, rng):
+    sisa = [int(d) for d in derajat]
+    n = len(sisa)
+    kandidat = _IndeksKandidat(sisa, 2)
+    edges = array('i')
+    edge_counts = _TabelPasangan(n, kapasitas=jumlah_ganda)
+
+    for i in range(jumlah_loop):
+        if not kandidat:
+            raise ValueError(f"Berhenti pada loop ke-{i + 1}. Tidak ada lagi simpul dengan sisa derajat >= 2.")
+        u = kandidat.pilih(rng)
+        edges.extend((u, u))
+        sisa[u] -= 2
+        kandidat.perbarui(u, sisa[u])
+
+    for i in range(jumlah_ganda):
+        pasangan = _pilih_pasangan(kandidat, edge_counts, n, rng)
+        if pasangan is None:
+            raise ValueError(f"Berhenti pada sisi ganda ke-{i + 1}. Tidak cukup pasangan simpul dengan sisa derajat >= 2.")
+        u, v = pasangan
+        edges.extend((u, v, u, v))
+        edge_counts.tambah(u * n + v if u < v else v * n + u, 2)
+        for w in pasangan:
+            sisa[w] -= 2
+            kandidat.perbarui(w, sisa[w])
+
+    return edges, sisa, edge_counts
+
+
+def alasan_syarat_tidak_mungkin(derajat, jumlah_loop, jumlah_ganda):
+    alasan = alasan_tidak_grafis(derajat)
+    if alasan is not None:
+        return alasan
+
+    derajat = np.asarray(derajat, dtype=np.int64)
+    total = int(derajat.sum())
+    dipakai = 2 * jumlah_loop + 4 * jumlah_ganda
+    if dipakai > total:
+        return (f"{jumlah_loop} loop dan {jumlah_ganda} sisi ganda butuh {dipakai} ujung sisi, "
+                f"padahal total derajat hanya {total}.")
+
+    jumlah_tunggal = (total - dipakai) // 2
+    ganjil = int((derajat % 2).sum())
+    if jumlah_tunggal < ganjil // 2:
+        return (f"{ganjil} simpul berderajat ganjil butuh sedikitnya {ganjil // 2} sisi tunggal, "
+                f"tetapi hanya tersisa {jumlah_tunggal} sisi tunggal.")
+
+    aktif = int((derajat > 0).sum())
+    if jumlah_ganda + jumlah_tunggal > aktif * (aktif - 1) // 2:
+        return (f"Dibutuhkan {jumlah_ganda + jumlah_tunggal} pasangan simpul berbeda, tetapi {aktif} simpul "
+                f"berderajat positif hanya punya {aktif * (aktif - 1) // 2} pasangan.")
+
+    cukup = int((derajat >= 2).sum())
+    if jumlah_ganda > cukup * (cukup - 1) // 2:
+        return (f"{jumlah_ganda} sisi ganda butuh pasangan berbeda dari simpul berderajat >= 2, "
+                f"tetapi hanya ada {cukup * (cukup - 1) // 2} pasangan.")
+
+    if jumlah_loop == 0:
+        alasan = alasan_tidak_grafis(derajat, maks_ganda=1 if jumlah_ganda == 0 else 2, izinkan_loop=False)
+        if alasan is not None:
+            return alasan
+    return _alasan_pembagian_syarat(derajat, jumlah_loop, jumlah_ganda, jumlah_tunggal)
+
+
+def _alasan_pembagian_syarat(derajat, jumlah_loop, jumlah_ganda, jumlah_tunggal):
+    d = np.sort(derajat)[::-1]
+    n = len(d)
+    r = np.arange(1, n + 1)
+    prefix = np.concatenate(([0], np.cumsum(d)))
+    total = prefix[-1]
+
+    def sisa_dibatasi(batas):
+        q = np.maximum(np.searchsorted(-d, -batas, side='left'), r)
+        return batas * (q - r) + total - prefix[q]
+
+    pasangan = r * (r - 1) // 2
+    ganda_dalam = np.minimum(jumlah_ganda, pasangan)
+    dalam = 2 * (2 * ganda_dalam + np.minimum(jumlah_tunggal, pasangan - ganda_dalam))
+    luar = sisa_dibatasi(r)
+    if jumlah_ganda:
+        luar = np.minimum(sisa_dibatasi(2 * r), luar + jumlah_ganda - ganda_dalam)
+    loop = 2 * np.minimum(jumlah_loop, np.cumsum(d // 2))
+    kiri = prefix[1:]
+    kanan = loop + dalam + luar
+    gagal = np.flatnonzero(kiri > kanan)
+    if len(gagal):
+        i = gagal[0]
+        return (f"{r[i]} simpul berderajat terbesar butuh {kiri[i]} ujung sisi, tetapi dengan {jumlah_loop} loop, "
+                f"{jumlah_ganda} sisi ganda dan {jumlah_tunggal} sisi tunggal paling banyak {kanan[i]}.")
+    return None
+
+
+def _turunkan_puncak(w, jumlah, per_langkah=1):
+    heap = [(-x, i) for i, x in enumerate(w) if x >= 2]
+    heapq.heapify(heap)
+    hasil = [0] * len(w)
+    for _ in range(jumlah):
+        if len(heap) < per_langkah:
+            return None
+        puncak = [heapq.heappop(heap)[1] for _ in range(per_langkah)]
+        for z in puncak:
+            w[z] -= 2
+            hasil[z] += 1
+            if w[z] >= 2:
+                heapq.heappush(heap, (-w[z], z))
+    return hasil
+
+
+def _pisahkan_bentrok(eu, ev, n, rng, batas_langkah, peluang_naik=0.01):
+    kunci = lambda a, b: a * n + b if a < b else b * n + a
+    indeks = [{kunci(a, b): i for i, (a, b) in enumerate(zip(eu[x], ev[x]))} for x in (0, 1)]
+    bentrok = [k for k in indeks[0] if k in indeks[1]]
+    posisi = {k: i for i, k in enumerate(bentrok)}
+
+    def buang(k):
+        i = posisi.pop(k)
+        terakhir = bentrok.pop()
+        if terakhir != k:
+            bentrok[i] = terakhir
+            posisi[terakhir] = i
+
+    ukuran = (len(eu[0]), len(eu[1]))
+    for _ in range(batas_langkah):
+        if not bentrok:
+            return True
+        if rng.random() < 0.5:
+            x = rng.randrange(2)
+            i = indeks[x][bentrok[rng.randrange(len(bentrok))]]
+        else:
+            x = 0 if rng.randrange(ukuran[0] + ukuran[1]) < ukuran[0] else 1
+            i = rng.randrange(ukuran[x])
+        if ukuran[x] < 2:
+            continue
+        j = rng.randrange(ukuran[x] - 1)
+        if j >= i:
+            j += 1
+        a, b = eu[x][i], ev[x][i]
+        c, d = (eu[x][j], ev[x][j]) if rng.random() < 0.5 else (ev[x][j], eu[x][j])
+        if a == d or c == b:
+            continue
+        sendiri, lain = indeks[x], indeks[1 - x]
+        lama = (kunci(a, b), kunci(c, d))
+        baru = (kunci(a, d), kunci(c, b))
+        if baru[0] == baru[1] or baru[0] in sendiri or baru[1] in sendiri:
+            continue
+        selisih = sum(k in lain for k in baru) - sum(k in lain for k in lama)
+        if selisih > 0 and rng.random() >= peluang_naik:
+            continue
+        for k in lama:
+            del sendiri[k]
+            if k in posisi:
+                buang(k)
+        for k, t in zip(baru, (i, j)):
+            sendiri[k] = t
+            if k in lain:
+                posisi[k] = len(bentrok)
+                bentrok.append(k)
+        eu[x][i], ev[x][i], eu[x][j], ev[x][j] = a, d, c, b
+    return not bentrok
+
+
+def _pasangan_ke(k, s):
+    sisa = s * (s - 1) // 2 - 1 - k
+    a = s - 2 - (math.isqrt(8 * sisa + 1) - 1) // 2
+    return a, k - a * (2 * s - a - 1) // 2 + a + 1
+
+
+def _cari_syarat_menyeluruh(derajat, jumlah_loop, jumlah_ganda, batas_langkah, batas_simpul=16):
+    simpul = [i for i, d in enumerate(derajat) if d > 0]
+    s = len(simpul)
+    if s > batas_simpul:
+        return False
+    simpul.sort(key=lambda i: -derajat[i])
+    jumlah_pasangan = s * (s - 1) // 2
+    sisa = [int(derajat[i]) for i in simpul]
+    jumlah_tunggal = (sum(sisa) - 2 * jumlah_loop - 4 * jumlah_ganda) // 2
+    pilihan = [0] * jumlah_pasangan
+    coba = [0] * (jumlah_pasangan + 1)
+    kapasitas = [0] * (jumlah_pasangan + 1)
+    kapasitas[0] = sum(sisa)
+    k = tunggal = ganda = langkah = 0
+    masuk = True
+
+    while True:
+        if masuk:
+            langkah += 1
+            if langkah > batas_langkah:
+                return False
+            if k == jumlah_pasangan:
+                if tunggal == jumlah_tunggal and ganda == jumlah_ganda and all(r % 2 == 0 for r in sisa):
+                    break
+                masuk = False
+            elif kapasitas[k] < 2 * (jumlah_tunggal - tunggal) + 4 * (jumlah_ganda - ganda):
+                masuk = False
+            else:
+                coba[k] = 0
+        if not masuk:
+            if k == 0:
+                return None
+            k -= 1
+            a, b = _pasangan_ke(k, s)
+            kali = pilihan[k]
+            sisa[a] += kali
+            sisa[b] += kali
+            tunggal -= kali == 1
+            ganda -= kali == 2
+
+        a, b = _pasangan_ke(k, s)
+        tutup = b == s - 1
+        masuk = False
+        while coba[k] < 3:
+            kali = (2, 1, 0)[coba[k]]
+            coba[k] += 1
+            if sisa[a] < kali or sisa[b] < kali:
+                continue
+            if (kali == 1 and tunggal == jumlah_tunggal) or (kali == 2 and ganda == jumlah_ganda):
+                continue
+            sisa[a] -= kali
+            sisa[b] -= kali
+            if not tutup or sisa[a] % 2 == 0:
+                pilihan[k] = kali
+                tunggal += kali == 1
+                ganda += kali == 2
+                kapasitas[k + 1] = kapasitas[k] - 2 * kali - (sisa[a] if tutup else 0)
+                k += 1
+                masuk = True
+                break
+            sisa[a] += kali
+            sisa[b] += kali
+
+    edges = array('i')
+    for k, kali in enumerate(pilihan):
+        a, b = _pasangan_ke(k, s)
+        edges.extend((simpul[a], simpul[b]) * kali)
+    for i, r in zip(simpul, sisa):
+        edges.extend((i, i) * (r // 2))
+    return edges
+
+
+def _syarat_terarah(w, jumlah_ganda, rng):
+    w = list(w)
+    n = len(w)
+    ganda = _turunkan_puncak(w, jumlah_ganda, per_langkah=2)
+    if (ganda is None or alasan_tidak_grafis(ganda, maks_ganda=1, izinkan_loop=False) is not None
+            or alasan_tidak_grafis(w, maks_ganda=1, izinkan_loop=False) is not None):
+        return None
+    sisi_ganda = _konstruksi_havel_hakimi(ganda)
+    tunggal = _konstruksi_havel_hakimi(w)
+    eu = [tunggal[0::2].tolist(), sisi_ganda[0::2].tolist()]
+    ev = [tunggal[1::2].tolist(), sisi_ganda[1::2].tolist()]
+    if not _pisahkan_bentrok(eu, ev, n, rng, 20 * (len(eu[0]) + len(eu[1])) + 1000):
+        return None
+    edges = array('i')
+    for u, v in zip(eu[1], ev[1]):
+        edges.extend((u, v, u, v))
+    for u, v in zip(eu[0], ev[0]):
+        edges.extend((u, v))
+    return edges
+
+
+def _syarat_komplemen(w, jumlah_ganda, rng):
+    aktif = [u for u, d in enumerate(w) if d > 0]
+    s = len(aktif)
+    m = sum(w) // 2
+    pasangan = s * (s - 1) // 2
+    ganda_komplemen = pasangan + jumlah_ganda - m
+    komplemen = [2 * (s - 1) - w[u] for u in aktif]
+    if ganda_komplemen < 0 or min(komplemen, default=0) < 0 or 2 * pasangan - m > 3 * m:
+        return None
+    sisi = _syarat_terarah(komplemen, ganda_komplemen, rng)
+    if sisi is None:
+        return None
+    kali = {}
+    for a, b in zip(sisi[0::2], sisi[1::2]):
+        k = a * s + b if a < b else b * s + a
+        kali[k] = kali.get(k, 0) + 1
+    edges = array('i')
+    for a in range(s):
+        for b in range(a + 1, s):
+            edges.extend((aktif[a], aktif[b]) * (2 - kali.get(a * s + b, 0)))
+    return edges
+
+
+def _cari_syarat_tukar(derajat, jumlah_loop, jumlah_ganda, rng, batas_langkah, peluang_naik=0.01):
+    graf = _realisasi_awal([int(d) for d in derajat], maks_ganda=2, izinkan_loop=True)
+    eu, ev = graf.u.tolist(), graf.v.tolist()
+    n, m = graf.jumlah_simpul, graf.jumlah_sisi
+    kali = _TabelPasangan.dari_sisi(graf.u, graf.v, n)
+    loop = sum(a == b for a, b in zip(eu, ev))
+    ganda = int((np.frombuffer(kali._hitung, dtype=np.uint32) == 2).sum())
+
+    for _ in range(batas_langkah):
+        jarak = abs(loop - jumlah_loop) + abs(ganda - jumlah_ganda)
+        if jarak == 0:
+            edges = array('i')
+            for u, v in zip(eu, ev):
+                edges.extend((u, v))
+            return edges
+        if m < 2:
+            return None
+        i = rng.randrange(m)
+        j = rng.randrange(m - 1)
+        if j >= i:
+            j += 1
+        a, b = eu[i], ev[i]
+        c, d = (eu[j], ev[j]) if rng.random() < 0.5 else (ev[j], eu[j])
+        lama = ((a * n + b if a < b else b * n + a, a, b), (c * n + d if c < d else d * n + c, c, d))
+        baru = ((a * n + d if a < d else d * n + a, a, d), (c * n + b if c < b else b * n + c, c, b))
+        selisih_ganda = 0
+        for kunci, x, y in lama:
+            if x != y:
+                selisih_ganda -= (kali[kunci] == 2) - (kali[kunci] == 3)
+                kali.tambah(kunci, -1)
+        for kunci, x, y in baru:
+            if x != y:
+                kali.tambah(kunci)
+                selisih_ganda += (kali[kunci] == 2) - (kali[kunci] == 3)
+        selisih_loop = (a == d) + (c == b) - (a == b) - (c == d)
+        jarak_baru = abs(loop + selisih_loop - jumlah_loop) + abs(ganda + selisih_ganda - jumlah_ganda)
+        if (all(x == y or kali[kunci] <= 2 for kunci, x, y in baru)
+                and (jarak_baru <= jarak or rng.random() < peluang_naik)):
+            eu[i], ev[i], eu[j], ev[j] = a, d, c, b
+            loop += selisih_loop
+            ganda += selisih_ganda
+        else:
+            for kunci, x, y in baru:
+                if x != y:
+                    kali.tambah(kunci, -1)
+            for kunci, x, y in lama:
+                if x != y:
+                    kali.tambah(kunci)
+    return None
+
+
+def _konstruksi_syarat_tepat(derajat, jumlah_loop, jumlah_ganda, rng, batas_langkah=200000, batas_simpul=16,
+                             faktor_tukar=50):
+    alasan = alasan_syarat_tidak_mungkin(derajat, jumlah_loop, jumlah_ganda)
+    if alasan is not None:
+        raise ValueError(alasan)
+
+    w = [int(d) for d in derajat]
+    loop = _turunkan_puncak(w, jumlah_loop)
+    if loop is not None:
+        sisi = _syarat_terarah(w, jumlah_ganda, rng)
+        if sisi is None:
+            sisi = _syarat_komplemen(w, jumlah_ganda, rng)
+        if sisi is not None:
+            edges = array('i')
+            for u, jumlah in enumerate(loop):
+                edges.extend((u, u) * jumlah)
+            return edges + sisi
+
+    edges = _cari_syarat_menyeluruh(derajat, jumlah_loop, jumlah_ganda, batas_langkah, batas_simpul)
+    if edges is None:
+        raise ValueError(f"Pencarian menyeluruh membuktikan tidak ada graf dengan tepat {jumlah_loop} loop "
+                         f"dan {jumlah_ganda} sisi ganda untuk barisan derajat ini.")
+    if edges is False:
+        batas_tukar = faktor_tukar * (int(np.sum(derajat)) // 2) + 10000
+        edges = _cari_syarat_tukar(derajat, jumlah_loop, jumlah_ganda, rng, batas_tukar)
+    if edges is None:
+        raise ValueError(f"Konstruksi terarah gagal, pencarian menyeluruh terlalu besar (lebih dari {batas_simpul} "
+                         f"simpul aktif atau {batas_langkah} langkah) dan pencarian tukar sisi tidak menemukan "
+                         f"realisasi dalam {batas_tukar} langkah; kelayakan tidak dapat dipastikan.")
+    return edges
+
+
+METODE_GRAF = ("numpy", "stub", "havel_hakimi", "mcmc", "syarat", "syarat_tepat")
+
+
+def buat_graf(derajat, seed=None, maks_ganda=2, metode="numpy", maks_ulang=20, faktor_campur=10,
+              jumlah_loop=0, jumlah_ganda=0, izinkan_loop=True):
+    if metode not in METODE_GRAF:
+        raise ValueError(f"Metode '{metode}' tidak dikenal. Pilih: {', '.join(METODE_GRAF)}.")
+    if jumlah_loop < 0 or jumlah_ganda < 0:
+        raise ValueError("Jumlah loop dan jumlah sisi ganda tidak boleh negatif.")
+    if jumlah_loop and not izinkan_loop:
+        raise ValueError(f"Diminta {jumlah_loop} loop, padahal loop dilarang.")
+    if metode == "syarat_tepat" and (maks_ganda is None or maks_ganda > 2):
+        raise ValueError("Metode syarat_tepat hanya mendukung batas 1 atau 2 sisi paralel per pasangan simpul.")
+    if jumlah_ganda and maks_ganda is not None and maks_ganda < 2:
+        raise ValueError(f"Diminta {jumlah_ganda} sisi ganda, padahal batas sisi paralel hanya {maks_ganda}.")
+    alasan = alasan_tidak_grafis(derajat, maks_ganda=maks_ganda, izinkan_loop=izinkan_loop)
+    if alasan is not None:
+        raise ValueError(alasan)
+    derajat = _sebagai_barisan(derajat)
+
+    graf = GrafKompak(len(derajat))
+    if metode == "havel_hakimi":
+        graf.tambah_sisi_banyak(np.frombuffer(_konstruksi_havel_hakimi(derajat), dtype=np.int32))
+        return graf
+    if metode == "mcmc":
+        awal = _realisasi_awal(derajat, maks_ganda=maks_ganda, izinkan_loop=izinkan_loop)
+        return tukar_sisi_acak(awal, faktor_campur=faktor_campur, seed=_rng_python(seed), maks_ganda=maks_ganda,
+                               izinkan_loop=izinkan_loop)
+    if metode == "syarat":
+        rng = _rng_python(seed)
+        edges, sisa, edge_counts = _tempatkan_syarat(derajat, jumlah_loop, jumlah_ganda, rng)
+        for _ in range(maks_ulang):
+            sisa_edges = _pasangkan_stub(sisa, rng, maks_ganda=maks_ganda, edge_counts=edge_counts,
+                                         izinkan_loop=izinkan_loop)
+            if sisa_edges is not None:
+                graf.tambah_sisi_banyak(np.frombuffer(edges + sisa_edges, dtype=np.int32))
+                return graf
+        raise ValueError("Sisa derajat setelah membuat syarat tidak dapat dipasangkan.")
+    if metode == "syarat_tepat":
+        edges = _konstruksi_syarat_tepat(derajat, jumlah_loop, jumlah_ganda, _rng_python(seed))
+        graf.tambah_sisi_banyak(np.frombuffer(edges, dtype=np.int32))
+        return graf
+
+    rng = buat_rng(seed)
+    if metode == "numpy":
+        hasil = _pasangkan_stub_numpy(derajat, seed=rng, maks_ganda=maks_ganda, izinkan_loop=izinkan_loop)
+        if hasil is not None:
+            graf.tambah_sisi_banyak(hasil)
+            return graf
+
+    rng = _rng_python(rng)
+    for _ in range(maks_ulang):
+        edges = _pasangkan_stub(derajat.tolist(), rng, maks_ganda=maks_ganda, izinkan_loop=izinkan_loop)
+        if edges is not None:
+            graf.tambah_sisi_banyak(np.frombuffer(edges, dtype=np.int32))
+            return graf
+    awal = _realisasi_awal(derajat, maks_ganda=maks_ganda, izinkan_loop=izinkan_loop)
+    return tukar_sisi_acak(awal, faktor_campur=faktor_campur, seed=rng, maks_ganda=maks_ganda,
+                           izinkan_loop=izinkan_loop)
+
+
+class _PohonFenwick:
+
+    def __init__(self, nilai):
+        nilai = np.asarray(nilai, dtype=np.int64)
+        self.n = len(nilai)
+        prefix = np.concatenate(([0], np.cumsum(nilai)))
+        i = np.arange(1, self.n + 1)
+        self.pohon = np.concatenate(([0], prefix[i] - prefix[i - (i & -i)]))
+        self.total = int(prefix[-1])
+        self.langkah_awal = 1 << self.n.bit_length()
+
+    def cari(self, target):
+        target = np.array(target, dtype=np.int64)
+        pos = np.zeros(len(target), dtype=np.int64)
+        langkah = self.langkah_awal
+        while langkah:
+            berikut = pos + langkah
+            nilai = self.pohon[np.minimum(berikut, self.n)]
+            maju = (berikut <= self.n) & (nilai <= target)
+            pos = np.where(maju, berikut, pos)
+            target = np.where(maju, target - nilai, target)
+            langkah >>= 1
+        return pos, target
+
+
+class _PengambilStub:
+
+    def __init__(self, sisa, rng, ukuran_blok=1 << 12):
+        self.sisa = sisa
+        self.rng = rng
+        self.ukuran_blok = ukuran_blok
+        self.pulihkan(0, ())
+
+    def pulihkan(self, mulai, nilai):
+        sisa = np.frombuffer(self.sisa, dtype=np.int64)
+        sisa[mulai:mulai + len(nilai)] = nilai
+        self.total = int(sisa.sum())
+        self.pohon = _PohonFenwick(sisa)
+        self._simpul = self._ofset = ()
+        self._k = 0
+
+    def ambil(self):
+        if self._k == len(self._simpul):
+            if 2 * self.total < self.pohon.total:
+                self.pohon = _PohonFenwick(np.frombuffer(self.sisa, dtype=np.int64))
+            simpul, ofset = self.pohon.cari(self.rng.integers(0, self.pohon.total, self.ukuran_blok))
+            self._simpul, self._ofset = simpul.tolist(), ofset.tolist()
+            self._k = 0
+        k = self._k
+        self._k += 1
+        return self._simpul[k], self._ofset[k]
+
+    def pakai(self, v, jumlah=1):
+        self.sisa[v] -= jumlah
+        self.total -= jumlah
+
+
+def _pasangkan_simpul(p, pengambil, maks_ganda, izinkan_loop, batas_tolak):
+    sisa = pengambil.sisa
+    r = sisa[p]
+    kali = {}
+    mitra = []
+    loop_lain = []
+    tolak = 0
+    while r > 0 and tolak < batas_tolak:
+        v, ofset = pengambil.ambil()
+        if v == p:
+            if not izinkan_loop or ofset >= r - 1:
+                tolak += 1
+                continue
+            mitra.append(p)
+            pengambil.pakai(p, 2)
+            r -= 2
+        else:
+            c = kali.get(v, 0)
+            if ofset >= sisa[v] or (maks_ganda is not None and c >= maks_ganda):
+                tolak += 1
+                continue
+            kali[v] = c + 1
+            mitra.append(v)
+            pengambil.pakai(v)
+            pengambil.pakai(p)
+            r -= 1
+        tolak = 0
+    if r == 0:
+        return mitra, loop_lain
+
+    lanjut = np.frombuffer(sisa, dtype=np.int64)[p + 1:]
+    calon = np.flatnonzero(lanjut)
+    if maks_ganda is not None:
+        calon = np.setdiff1d(calon, [v - p - 1 for v, c in kali.items() if c >= maks_ganda], assume_unique=True)
+    if len(calon) > r + 1:
+        calon = calon[np.argpartition(-lanjut[calon], r)[:r + 1]]
+    heap = [(-sisa[v], v) for v in (calon + p + 1).tolist()]
+    heapq.heapify(heap)
+    while r and heap:
+        _, v = heapq.heappop(heap)
+        kali[v] = kali.get(v, 0) + 1
+        mitra.append(v)
+        pengambil.pakai(v)
+        pengambil.pakai(p)
+        r -= 1
+        if sisa[v] and (maks_ganda is None or kali[v] < maks_ganda):
+            heapq.heappush(heap, (-sisa[v], v))
+    if r and not izinkan_loop:
+        return None
+    if r % 2:
+        w = next((v for v in mitra if v != p and sisa[v]), None)
+        if w is None:
+            return None
+        mitra.remove(w)
+        loop_lain.append(w)
+        pengambil.pakai(w)
+        pengambil.pakai(p, -1)
+        r += 1
+    mitra.extend([p] * (r // 2))
+    pengambil.pakai(p, r)
+    return mitra, loop_lain
+
+
+def _pasangkan_blok(mulai, akhir, pengambil, maks_ganda, izinkan_loop, batas_tolak):
+    blok = []
+    for p in range(mulai, akhir):
+        if pengambil.sisa[p]:
+            hasil = _pasangkan_simpul(p, pengambil, maks_ganda, izinkan_loop, batas_tolak)
+            if hasil is None:
+                return None
+            blok.append((p, *hasil))
+    return blok
+
+
+def alirkan_sisi(derajat, seed=None, maks_ganda=2, izinkan_loop=True, batas_tolak=32, ukuran_ekor=4096,
+                 maks_ulang=20):
+    alasan = alasan_tidak_grafis(derajat, maks_ganda=maks_ganda, izinkan_loop=izinkan_loop)
+    if alasan is not None:
+        raise ValueError(alasan)
+
+    rng = _rng_python(seed)
+    derajat = _sebagai_barisan(derajat)
+    n = len(derajat)
+    urutan = np.argsort(-derajat, kind='stable')
+    for _ in range(maks_ulang):
+        sisa = array('q')
+        sisa.frombytes(derajat[urutan].astype(np.int64).tobytes())
+        pengambil = _PengambilStub(sisa, buat_rng(rng))
+        residu = np.frombuffer(sisa, dtype=np.int64)
+        terkirim = 0
+        mulai = 0
+        while pengambil.total > 2 * ukuran_ekor:
+            salinan = residu[mulai:].copy()
+            akhir, jumlah = mulai, 0
+            while akhir < n and jumlah < max(ukuran_ekor, (n - mulai) // 8):
+                jumlah += sisa[akhir]
+                akhir += 1
+            blok = _pasangkan_blok(mulai, akhir, pengambil, maks_ganda, izinkan_loop, batas_tolak)
+            if blok is None or (not izinkan_loop and alasan_tidak_grafis(residu[akhir:], maks_ganda, False)):
+                pengambil.pulihkan(mulai, salinan)
+                blok = _pasangkan_blok(mulai, akhir, pengambil, maks_ganda, izinkan_loop, 0)
+                if blok is None or (not izinkan_loop and alasan_tidak_grafis(residu[akhir:], maks_ganda, False)):
+                    break
+            for p, mitra, loop_lain in blok:
+                u = int(urutan[p])
+                yield from zip(itertools.repeat(u), urutan[mitra].tolist())
+                for w in urutan[loop_lain].tolist():
+                    yield w, w
+                terkirim += len(mitra) + len(loop_lain)
+            mulai = akhir
+        else:
+            graf = buat_graf(residu[mulai:], seed=rng, maks_ganda=maks_ganda, izinkan_loop=izinkan_loop)
+            yield from zip(urutan[mulai + graf.u].tolist(), urutan[mulai + graf.v].tolist())
+            return
+        if terkirim:
+            raise ValueError("Pemasangan stub menemui jalan buntu setelah sisa barisan derajat tidak lagi dapat "
+                             f"direalisasikan; {terkirim} sisi sudah ditulis sehingga keluaran terpotong.")
+    raise ValueError(f"Pemasangan stub menemui jalan buntu pada {maks_ulang} percobaan; belum ada sisi yang ditulis.")
+
+
+def tulis_aliran_sisi(sisi, berkas, format="tsv", ukuran_blok=1 << 16):
+    buffer = array('i')
+    for u, v in sisi:
+        buffer.append(u)
+        buffer.append(v)
+        if len(buffer) >= 2 * ukuran_blok:
+            _tulis_blok(buffer, berkas, format)
+            buffer = array('i')
+    if buffer:
+        _tulis_blok(buffer, berkas, format)
+
+
+def _tulis_blok(buffer, berkas, format):
+    if format == "bin":
+        if sys.byteorder != 'little':
+            buffer.byteswap()
+        berkas.write(buffer.tobytes())
+    else:
+        ujung = np.frombuffer(buffer, dtype=np.int32) + 1
+        berkas.write(''.join(map('{}\t{}\n'.format, ujung[0::2].tolist(), ujung[1::2].tolist())))
+
+
+def _buka_keluaran(path, biner):
+    mode = 'wb' if biner else 'wt'
+    if path == '-':
+        return nullcontext(sys.stdout.buffer if biner else sys.stdout)
+    if path.endswith('.gz'):
+        import gzip
+        return gzip.open(path, mode)
+    if path.endswith('.bz2'):
+        import bz2
+        return bz2.open(path, mode)
+    if path.endswith('.xz'):
+        import lzma
+        return lzma.open(path, mode)
+    return open(path, mode)
+
+
+def _buat_sampel(derajat, seeds, maks_ganda, metode, izinkan_loop, opsi):
+    return np.stack([buat_graf(derajat, seed=np.random.default_rng(s), maks_ganda=maks_ganda, metode=metode,
+                               izinkan_loop=izinkan_loop, **opsi).sisi()
+                     for s in seeds])
+
+
+def buat_ensembel(derajat, jumlah, seed=None, maks_ganda=2, metode="numpy", pekerja=None, izinkan_loop=True,
+                  **opsi):
+    alasan = alasan_tidak_grafis(derajat, maks_ganda=maks_ganda, izinkan_loop=izinkan_loop)
+    if alasan is not None:
+        raise ValueError(alasan)
+    derajat = _sebagai_barisan(derajat)
+    hasil = np.empty((jumlah, int(derajat.sum()) // 2, 2), dtype=np.int32)
+    if jumlah == 0:
+        return hasil
+
+    seeds = pecah_seed(seed, jumlah)
+    pekerja = pekerja or os.cpu_count() or 1
+    ukuran = max(1, -(-jumlah // (pekerja * 4)))
+    kelompok = [seeds[i:i + ukuran] for i in range(0, jumlah, ukuran)]
+
+    argumen = list(zip(*((derajat, k, maks_ganda, metode, izinkan_loop, opsi) for k in kelompok)))
+    with ProcessPoolExecutor(max_workers=pekerja) as executor:
+        bagian = map(_buat_sampel, *argumen) if pekerja == 1 else executor.map(_buat_sampel, *argumen)
+        mulai = 0
+        for sampel in bagian:
+            hasil[mulai:mulai + len(sampel)] = sampel
+            mulai += len(sampel)
+    return hasil
+
+
+_PANGKAT_SEPULUH = 10 ** np.arange(19, dtype=np.int64)
+
+
+def urai_histogram(teks):
+    if isinstance(teks, str):
+        teks = teks.encode()
+    b = np.frombuffer(teks, dtype=np.uint8)
+    angka = (b >= ord('0')) & (b <= ord('9'))
+    kali = (b == ord('x')) | (b == ord('X'))
+    sah = angka | kali | np.isin(b, np.frombuffer(b" \t\r\n,;", dtype=np.uint8))
+    if not sah.all():
+        i = int(np.argmin(sah))
+        raise ValueError(f"Karakter {chr(b[i])!r} pada posisi {i + 1} tidak dikenal.")
+    if not angka.any():
+        return HistogramDerajat([], [])
+
+    tepi = np.diff(np.concatenate(([0], angka.astype(np.int8), [0])))
+    mulai = np.flatnonzero(tepi == 1)
+    akhir = np.flatnonzero(tepi == -1)
+    panjang = akhir - mulai
+    if panjang.max() > 18:
+        raise ValueError("Angka terlalu besar.")
+
+    posisi = np.flatnonzero(angka)
+    pangkat = np.repeat(akhir, panjang) - 1 - posisi
+    digit = (b[posisi] - ord('0')).astype(np.int64) * _PANGKAT_SEPULUH[pangkat]
+    nilai = np.add.reduceat(digit, np.concatenate(([0], np.cumsum(panjang)[:-1])))
+
+    x = np.flatnonzero(kali)
+    if not len(x):
+        return HistogramDerajat.dari_barisan(nilai)
+    if x[0] == 0 or x[-1] == len(b) - 1 or not (angka[x - 1] & angka[x + 1]).all():
+        raise ValueError("Format ringkas harus berbentuk JUMLAHxDERAJAT, mis. 1000x3.")
+    pengali = np.searchsorted(akhir, x)
+    if np.isin(pengali + 1, pengali).any():
+        raise ValueError("Format ringkas hanya boleh satu 'x' per kelompok, mis. 1000x3.")
+    banyak = np.ones(len(nilai), dtype=np.int64)
+    banyak[pengali + 1] = nilai[pengali]
+    banyak[pengali] = 0
+    return HistogramDerajat(nilai, banyak)
+
+
+def baca_histogram(berkas):
+    return urai_histogram(berkas.read())
+
+
+def format_statistik(statistik):
+    if not statistik["jumlah_simpul"]:
+        return "Jumlah simpul: 0"
+    return "\n".join([
+        f"Jumlah simpul: {statistik['jumlah_simpul']} ({statistik['kelas_derajat']} kelas derajat)",
+        f"Total derajat: {statistik['total_derajat']} ({statistik['total_derajat'] / 2:g} sisi)",
+        f"Derajat: min {statistik['derajat_min']}, maks {statistik['derajat_maks']}, "
+        f"rata-rata {statistik['rata_rata']:.4g}, variansi {statistik['variansi']:.4g}",
+        f"Simpul berderajat ganjil: {statistik['simpul_ganjil']}",
+    ])
+
+
+def _kelompok_paralel(eu, ev, n):
+    a = np.minimum(eu, ev).astype(np.int64)
+    b = np.maximum(eu, ev).astype(np.int64)
+    m = len(a)
+    peringkat = np.zeros(m, dtype=np.int64)
+    ukuran = np.zeros(m, dtype=np.int64)
+    if not m:
+        return a, b, peringkat, ukuran
+    urut = np.argsort(a * n + b, kind='stable')
+    k = (a * n + b)[urut]
+    awal_grup = np.r_[True, k[1:] != k[:-1]]
+    posisi = np.arange(m)
+    peringkat[urut] = posisi - np.maximum.accumulate(np.where(awal_grup, posisi, 0))
+    panjang = np.diff(np.r_[np.flatnonzero(awal_grup), m])
+    ukuran[urut] = np.repeat(panjang, panjang)
+    return a, b, peringkat, ukuran
+
+
+def _kurva_sisi(pos, a, b, rad):
+    p0, p2 = pos[a], pos[b]
+    d = p2 - p0
+    kontrol = (p0 + p2) / 2 + rad[:, None] * np.column_stack((d[:, 1], -d[:, 0]))
+    return np.stack((p0, kontrol, p2), axis=1)
+
+
+def _kurva_loop(pos, u, besar, jari=0.0, sudut=np.pi / 6):
+    arah = pos[u] - (pos.mean(axis=0) if len(pos) else 0.0)
+    panjang = np.hypot(arah[:, 0], arah[:, 1])
+    arah = np.where(panjang[:, None] > 1e-12, arah / np.maximum(panjang, 1e-12)[:, None], [0.0, 1.0])
+    tegak = np.column_stack((-arah[:, 1], arah[:, 0]))
+    besar = besar[:, None]
+    p0 = jari * (np.cos(sudut) * arah - np.sin(sudut) * tegak)
+    p3 = jari * (np.cos(sudut) * arah + np.sin(sudut) * tegak)
+    return np.stack((p0, p0 + besar * (2 * arah - tegak), p3 + besar * (2 * arah + tegak), p3), axis=1)
+
+
+def _gambar_sisi(ax, pos, eu, ev, warna='black', lebar=1.0, agregat=False, batas_lencana=500, autoskala=True,
+                 ukuran_simpul=None):
+    from matplotlib.collections import LineCollection, PathCollection
+    from matplotlib.path import Path
+    from matplotlib.transforms import Affine2D
+
+    pos = np.asarray(pos, dtype=float)
+    a, b, peringkat, ukuran = _kelompok_paralel(np.asarray(eu), np.asarray(ev), len(pos))
+    if agregat:
+        wakil = peringkat == 0
+        a, b, ukuran = a[wakil], b[wakil], ukuran[wakil]
+        peringkat = np.zeros_like(ukuran)
+    loop = a == b
+    lurus = ~loop & ((ukuran == 1) | agregat)
+    lengkung = ~loop & ~lurus
+    skala = 0.08 * max(float(np.ptp(pos, axis=0).max()) if len(pos) else 0.0, 1e-9)
+
+    warna_garis = warna_loop = warna
+    lebar_garis, lebar_loop = lebar, lebar
+    if agregat and len(ukuran) and ukuran.max() > 1:
+        import matplotlib
+
+        peta = matplotlib.colormaps['plasma']
+        norma = matplotlib.colors.LogNorm(1, ukuran.max() * 1.5)
+        warna_garis, warna_loop = peta(norma(ukuran[lurus])), peta(norma(ukuran[loop]))
+        lebar_garis, lebar_loop = lebar * (1 + np.log2(ukuran[lurus])), lebar * (1 + np.log2(ukuran[loop]))
+
+    artis = [ax.add_collection(LineCollection(np.stack((pos[a[lurus]], pos[b[lurus]]), axis=1),
+                                              colors=warna_garis, linewidths=lebar_garis, zorder=1))]
+    rad = 0.2 * (peringkat[lengkung] - (ukuran[lengkung] - 1) / 2)
+    busur = _kurva_sisi(pos, a[lengkung], b[lengkung], rad)
+    if ukuran_simpul is None:
+        simpul_loop = _kurva_loop(pos, a[loop], skala * (1 + 0.5 * peringkat[loop]))
+        opsi_loop = {}
+    else:
+        jari = np.sqrt(ukuran_simpul) / 2
+        simpul_loop = _kurva_loop(pos, a[loop], max(8.0, 0.6 * jari) * (1 + 0.5 * peringkat[loop]), jari=jari)
+        opsi_loop = dict(offsets=pos[a[loop]], offset_transform=ax.transData,
+                         transform=Affine2D().scale(1 / 72) + ax.figure.dpi_scale_trans)
+    kode_busur = [Path.MOVETO, Path.CURVE3, Path.CURVE3]
+    kode_loop = [Path.MOVETO, Path.CURVE4, Path.CURVE4, Path.CURVE4]
+    if len(busur):
+        artis.append(ax.add_collection(PathCollection([Path(v, kode_busur) for v in busur], facecolors='none',
+                                                      edgecolors=warna, linewidths=lebar, zorder=1)))
+    if len(simpul_loop):
+        artis.append(ax.add_collection(PathCollection([Path(v, kode_loop) for v in simpul_loop], facecolors='none',
+                                                      edgecolors=warna_loop, linewidths=lebar_loop, zorder=1,
+                                                      **opsi_loop)))
+        if ukuran_simpul is None:
+            simpul_loop = simpul_loop + pos[a[loop]][:, None]
+            ax.update_datalim(simpul_loop.reshape(-1, 2))
+
+    if agregat:
+        ganda = lurus & (ukuran > 1)
+        loop_ganda = ukuran[loop] > 1
+        puncak = (simpul_loop[:, 0] + 3 * simpul_loop[:, 1] + 3 * simpul_loop[:, 2] + simpul_loop[:, 3]) / 8
+        if ukuran_simpul is None:
+            geser = np.zeros((int(ganda.sum() + loop_ganda.sum()), 2))
+            titik = np.concatenate(((pos[a[ganda]] + pos[b[ganda]]) / 2, puncak[loop_ganda]))
+        else:
+            geser = np.concatenate((np.zeros((int(ganda.sum()), 2)), puncak[loop_ganda]))
+            titik = np.concatenate(((pos[a[ganda]] + pos[b[ganda]]) / 2, pos[a[loop]][loop_ganda]))
+        teks = [str(c) for c in ukuran[ganda].tolist()] + [f"\u00d7{c}" for c in ukuran[loop][loop_ganda].tolist()]
+        for (x, y), (dx, dy), t in list(zip(titik.tolist(), geser.tolist(), teks))[:batas_lencana]:
+            artis.append(ax.annotate(t, (x, y), xytext=(dx, dy), textcoords='offset points', fontsize=8,
+                                     ha='center', va='center', zorder=3,
+                                     bbox=dict(boxstyle='round,pad=0.2', facecolor='white', edgecolor='gray',
+                                               linewidth=0.5)))
+    if autoskala:
+        if ukuran_simpul is not None:
+            jangkau = max(float(np.abs(simpul_loop).max()) if len(simpul_loop) else 0.0, np.sqrt(ukuran_simpul) / 2) + 4
+            sisi_kotak = float(min(ax.get_window_extent().size)) * 72 / ax.figure.dpi
+            ax.margins(min(jangkau / max(sisi_kotak - 2 * jangkau, 1e-9), 1.0))
+        ax.autoscale_view()
+    return artis
+
+
+def _normalkan_posisi(pos):
+    if not len(pos):
+        return pos
+    pos = pos - pos.mean(axis=0)
+    jangkau = np.abs(pos).max()
+    return pos / jangkau if jangkau > 0 else pos
+
+
+def _gaya_tolak_tepat(pos, k):
+    d = pos[:, None, :] - pos[None, :, :]
+    jarak2 = np.maximum((d ** 2).sum(axis=2), 1e-12)
+    np.fill_diagonal(jarak2, np.inf)
+    return (d * (k * k / jarak2)[:, :, None]).sum(axis=1)
+
+
+_KERNEL_GRID = {}
+
+
+def _gaya_tolak_grid(pos, k, ukuran):
+    if ukuran not in _KERNEL_GRID:
+        geser = np.fft.fftfreq(2 * ukuran, 1 / (2 * ukuran))
+        gx, gy = np.meshgrid(geser, geser, indexing='ij')
+        r2 = gx ** 2 + gy ** 2
+        r2[0, 0] = np.inf
+        _KERNEL_GRID[ukuran] = (np.fft.rfft2(gx / r2), np.fft.rfft2(gy / r2))
+    kx, ky = _KERNEL_GRID[ukuran]
+
+    lo = pos.min(axis=0)
+    h = max(float((pos.max(axis=0) - lo).max()), 1e-9) / (ukuran - 1.001)
+    g = (pos - lo) / h
+    i0 = np.floor(g).astype(np.int64)
+    f = g - i0
+    sudut = [(0, 0, (1 - f[:, 0]) * (1 - f[:, 1])), (1, 0, f[:, 0] * (1 - f[:, 1])),
+             (0, 1, (1 - f[:, 0]) * f[:, 1]), (1, 1, f[:, 0] * f[:, 1])]
+    indeks = [(i0[:, 0] + dx) * (2 * ukuran) + i0[:, 1] + dy for dx, dy, _ in sudut]
+
+    massa = np.zeros(4 * ukuran * ukuran)
+    for idx, (_, _, bobot) in zip(indeks, sudut):
+        massa += np.bincount(idx, weights=bobot, minlength=len(massa))
+    massa = np.fft.rfft2(massa.reshape(2 * ukuran, 2 * ukuran))
+    skala = k * k / h
+    medan = [np.fft.irfft2(massa * kernel, s=(2 * ukuran, 2 * ukuran)).ravel() * skala for kernel in (kx, ky)]
+
+    gaya = np.zeros_like(pos)
+    for idx, (_, _, bobot) in zip(indeks, sudut):
+        gaya[:, 0] += medan[0][idx] * bobot
+        gaya[:, 1] += medan[1][idx] * bobot
+    return gaya
+
+
+def _tata_letak_gaya(n, a, b, bobot, rng, iterasi=100, posisi_awal=None, suhu=None, batas_tepat=500):
+    pos = rng.uniform(-1, 1, (n, 2)) if posisi_awal is None else np.array(posisi_awal, dtype=float)
+    if n < 2:
+        return pos
+    k = 2 / np.sqrt(n)
+    suhu = 0.2 if suhu is None else suhu
+    ukuran = int(np.clip(2 * np.sqrt(n), 32, 256))
+
+    for langkah in range(iterasi):
+        gaya = _gaya_tolak_tepat(pos, k) if n <= batas_tepat else _gaya_tolak_grid(pos, k, ukuran)
+        d = pos[a] - pos[b]
+        tarik = d * (np.hypot(d[:, 0], d[:, 1]) * bobot / k)[:, None]
+        for sumbu in range(2):
+            gaya[:, sumbu] -= np.bincount(a, weights=tarik[:, sumbu], minlength=n)
+            gaya[:, sumbu] += np.bincount(b, weights=tarik[:, sumbu], minlength=n)
+        gaya -= pos * (k * np.hypot(pos[:, 0], pos[:, 1]))[:, None]
+
+        batas = suhu * (1 - langkah / iterasi)
+        panjang = np.maximum(np.hypot(gaya[:, 0], gaya[:, 1]), 1e-12)
+        pos += gaya * (np.minimum(panjang, batas) / panjang)[:, None]
+    return pos
+
+
+def _kasarkan(n, a, b, bobot, rng):
+    induk = np.full(n, -1, dtype=np.int64)
+    urut = np.lexsort((rng.random(len(a)), -bobot))
+    jumlah = 0
+    for u, v in zip(a[urut].tolist(), b[urut].tolist()):
+        if induk[u] < 0 and induk[v] < 0:
+            induk[u] = induk[v] = jumlah
+            jumlah += 1
+
+    sendiri = induk < 0
+    lepas = sendiri[a] & ~sendiri[b]
+    induk[a[lepas]] = induk[b[lepas]]
+    lepas = sendiri[b] & ~sendiri[a]
+    induk[b[lepas]] = induk[a[lepas]]
+    sisa = np.flatnonzero(induk < 0)
+    induk[sisa] = jumlah + np.arange(len(sisa)) // 2
+    jumlah += -(-len(sisa) // 2)
+
+    pa, pb = induk[a], induk[b]
+    pisah = pa != pb
+    kunci = np.minimum(pa, pb)[pisah] * jumlah + np.maximum(pa, pb)[pisah]
+    kunci, kebalikan = np.unique(kunci, return_inverse=True)
+    return induk, jumlah, kunci // jumlah, kunci % jumlah, np.bincount(kebalikan, weights=bobot[pisah])
+
+
+def _tata_letak_bertingkat(n, a, b, bobot, rng, iterasi=50, posisi_awal=None, batas_kasar=64):
+    if posisi_awal is not None:
+        return _tata_letak_gaya(n, a, b, bobot, rng, iterasi=iterasi, posisi_awal=posisi_awal,
+                                suhu=0.02)
+
+    tingkat = []
+    while n > batas_kasar:
+        induk, n_kasar, a_kasar, b_kasar, bobot_kasar = _kasarkan(n, a, b, bobot, rng)
+        if n_kasar > 0.95 * n:
+            break
+        tingkat.append((n, a, b, bobot, induk))
+        n, a, b, bobot = n_kasar, a_kasar, b_kasar, bobot_kasar
+
+    pos = _tata_letak_gaya(n, a, b, bobot, rng, iterasi=4 * iterasi)
+    for n, a, b, bobot, induk in reversed(tingkat):
+        k = 2 / np.sqrt(n)
+        pos = pos[induk] + rng.normal(scale=0.1 * k, size=(n, 2))
+        pos = _tata_letak_gaya(n, a, b, bobot, rng, iterasi=iterasi, posisi_awal=pos, suhu=2 * k)
+    return pos
+
+
+def _tata_letak_lingkaran(n, a, b, bobot, rng, posisi_awal=None):
+    sudut = 2 * np.pi * np.arange(n) / max(n, 1)
+    return np.column_stack((np.cos(sudut), np.sin(sudut)))
+
+
+def _tata_letak_spektral(n, a, b, bobot, rng, posisi_awal=None):
+    try:
+        from scipy.sparse import coo_matrix, diags
+        from scipy.sparse.linalg import ArpackError, eigsh
+    except ImportError:
+        return _tata_letak_lingkaran(n, a, b, bobot, rng)
+
+    if n < 4 or not len(a):
+        return _tata_letak_lingkaran(n, a, b, bobot, rng)
+    adj = coo_matrix((bobot, (a, b)), shape=(n, n)).tocsr()
+    adj = adj + adj.T
+    if not adj.count_nonzero():
+        return _tata_letak_lingkaran(n, a, b, bobot, rng)
+    derajat = np.asarray(adj.sum(axis=1)).ravel()
+    akar = np.where(derajat > 0, 1 / np.sqrt(np.maximum(derajat, 1e-12)), 0)
+    normal = diags(akar) @ adj @ diags(akar)
+    try:
+        _, vektor = eigsh(normal, k=3, which='LA', v0=rng.random(n), tol=1e-4)
+    except ArpackError:
+        return _tata_letak_lingkaran(n, a, b, bobot, rng)
+    return vektor[:, :2] * akar[:, None]
+
+
+METODE_TATA_LETAK = {
+    "gaya": _tata_letak_gaya,
+    "bertingkat": _tata_letak_bertingkat,
+    "lingkaran": _tata_letak_lingkaran,
+    "spektral": _tata_letak_spektral,
+}
+
+
+class CacheTataLetak:
+
+    def __init__(self, kapasitas=32, direktori=None, ambang_hangat=0.5):
+        self.kapasitas = kapasitas
+        self.direktori = direktori
+        self.ambang_hangat = ambang_hangat
+        self._entri = OrderedDict()
+
+    @staticmethod
+    def kunci(n, sisi_kunci, bobot, metode, opsi):
+        h = hashlib.blake2b(digest_size=16)
+        h.update(f"{n}|{metode}|{sorted(opsi.items())!r}|".encode())
+        h.update(np.ascontiguousarray(sisi_kunci, dtype='<i8').tobytes())
+        h.update(np.ascontiguousarray(bobot, dtype='<f8').tobytes())
+        return h.hexdigest()
+
+    def _path(self, kunci):
+        return os.path.join(self.direktori, f"{kunci}.npz")
+
+    def ambil(self, kunci):
+        if kunci in self._entri:
+            self._entri.move_to_end(kunci)
+            return self._entri[kunci][0].copy()
+        if self.direktori is None or not os.path.exists(self._path(kunci)):
+            return None
+        with np.load(self._path(kunci)) as data:
+            posisi, sisi_kunci = data["posisi"], data["sisi"]
+        self._ingat(kunci, posisi, sisi_kunci)
+        return posisi.copy()
+
+    def simpan(self, kunci, posisi, sisi_kunci):
+        self._ingat(kunci, posisi.copy(), sisi_kunci)
+        if self.direktori is not None:
+            os.makedirs(self.direktori, exist_ok=True)
+            sementara = f"{self._path(kunci)}.{os.getpid()}.tmp"
+            with open(sementara, 'wb') as berkas:
+                np.savez(berkas, posisi=posisi, sisi=sisi_kunci)
+            os.replace(sementara, self._path(kunci))
+
+    def _ingat(self, kunci, posisi, sisi_kunci):
+        self._entri[kunci] = (posisi, sisi_kunci)
+        self._entri.move_to_end(kunci)
+        while len(self._entri) > self.kapasitas:
+            self._entri.popitem(last=False)
+
+    def posisi_hangat(self, n, sisi_kunci):
+        terbaik, skor_terbaik = None, self.ambang_hangat
+        for posisi, lama in reversed(self._entri.values()):
+            sama = len(np.intersect1d(sisi_kunci, lama, assume_unique=True))
+            gabungan = len(sisi_kunci) + len(lama) - sama
+            skor = sama / gabungan if gabungan else float(len(posisi) == n)
+            if skor > skor_terbaik:
+                terbaik, skor_terbaik = posisi, skor
+        if terbaik is None:
+            return None
+
+        hangat = np.full((n, 2), np.nan)
+        dipakai = min(n, len(terbaik))
+        hangat[:dipakai] = terbaik[:dipakai]
+        return hangat
+
+
+def _isi_posisi_kosong(posisi, a, b, rng):
+    kosong = np.isnan(posisi[:, 0])
+    if not kosong.any():
+        return posisi
+    n = len(posisi)
+    for sumber, tujuan in ((a, b), (b, a)):
+        pakai = kosong[tujuan] & ~kosong[sumber]
+        jumlah = np.bincount(tujuan[pakai], minlength=n)
+        for sumbu in range(2):
+            total = np.bincount(tujuan[pakai], weights=posisi[sumber[pakai], sumbu], minlength=n)
+            posisi[:, sumbu] = np.where(kosong & (jumlah > 0), total / np.maximum(jumlah, 1), posisi[:, sumbu])
+        kosong = np.isnan(posisi[:, 0])
+    posisi[kosong] = rng.uniform(-1, 1, (int(kosong.sum()), 2))
+    return posisi
+
+
+def tata_letak(graf, metode="otomatis", seed=None, posisi_awal=None, cache=None, **opsi):
+    n = graf.jumlah_simpul
+    if metode == "otomatis":
+        metode = "bertingkat"
+    if metode not in METODE_TATA_LETAK:
+        raise ValueError(f"Metode tata letak '{metode}' tidak dikenal. Pilih: {', '.join(METODE_TATA_LETAK)}.")
+    a, b, bobot = graf.ringkas()
+    rng = buat_rng(seed)
+
+    if cache is not None:
+        sisi_kunci = (a << 32) | b
+        kunci = cache.kunci(n, sisi_kunci, bobot, metode, opsi)
+        pos = cache.ambil(kunci)
+        if pos is not None:
+            return pos
+        if posisi_awal is None:
+            posisi_awal = cache.posisi_hangat(n, sisi_kunci)
+    if posisi_awal is not None:
+        posisi_awal = _isi_posisi_kosong(np.array(posisi_awal, dtype=float), a, b, rng)
+
+    pos = METODE_TATA_LETAK[metode](n, a, b, bobot, rng, posisi_awal=posisi_awal, **opsi)
+    pos = _normalkan_posisi(np.asarray(pos, dtype=float))
+    if cache is not None:
+        cache.simpan(kunci, pos, sisi_kunci)
+    return pos
+
+
+def _batas_sampel(panjang, anggaran):
+    bawah, atas = 2, int(panjang.max())
+    while bawah < atas:
+        tengah = (bawah + atas + 1) // 2
+        if np.minimum(panjang, tengah).sum() <= anggaran:
+            bawah = tengah
+        else:
+            atas = tengah - 1
+    return bawah
+
+
+def _potong_segmen(p0, p1, atas):
+    d = p1 - p0
+    t0 = np.zeros(len(p0))
+    t1 = np.ones(len(p0))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        for sumbu in range(2):
+            ta = -p0[:, sumbu] / d[:, sumbu]
+            tb = (atas[sumbu] - p0[:, sumbu]) / d[:, sumbu]
+            diam = d[:, sumbu] == 0
+            di_luar = diam & ((p0[:, sumbu] < 0) | (p0[:, sumbu] > atas[sumbu]))
+            t0 = np.where(diam, t0, np.maximum(t0, np.minimum(ta, tb)))
+            t1 = np.where(di_luar, -1.0, np.where(diam, t1, np.minimum(t1, np.maximum(ta, tb))))
+    tampak = t0 <= t1
+    t0, t1 = t0[tampak, None], t1[tampak, None]
+    return p0[tampak] + t0 * d[tampak], p0[tampak] + t1 * d[tampak]
+
+
+def rasterkan_sisi(posisi, eu, ev, lebar=1024, tinggi=None, antialias=False, anggaran_sampel=None, batas=None,
+                   blok=1 << 22):
+    tinggi = tinggi or lebar
+    posisi = np.asarray(posisi, dtype=float)
+    buffer = np.zeros(tinggi * lebar)
+    if not len(posisi):
+        return buffer.reshape(tinggi, lebar)
+    if batas is None:
+        lo = posisi.min(axis=0)
+        jangkau = np.maximum(posisi.max(axis=0) - lo, 1e-12)
+    else:
+        lo = np.array([batas[0], batas[2]], dtype=float)
+        jangkau = np.maximum(np.array([batas[1] - batas[0], batas[3] - batas[2]], dtype=float), 1e-12)
+    px = (posisi - lo) / jangkau * [lebar - 1, tinggi - 1]
+
+    p0, p1 = px[np.asarray(eu)], px[np.asarray(ev)]
+    if batas is not None:
+        p0, p1 = _potong_segmen(p0, p1, (lebar - 1, tinggi - 1))
+    d = p1 - p0
+    panjang = np.ceil(np.abs(d).max(axis=1)).astype(np.int64) + 1
+    sampel = panjang
+    if anggaran_sampel is not None and len(panjang) and panjang.sum() > anggaran_sampel:
+        sampel = np.minimum(panjang, _batas_sampel(panjang, anggaran_sampel))
+    bobot_sisi = (panjang / sampel).astype(np.float32) if sampel is not panjang else None
+    mendatar = np.abs(d[:, 0]) >= np.abs(d[:, 1])
+    d /= np.maximum(sampel - 1, 1)[:, None]
+    kumulatif = np.cumsum(sampel)
+    mulai = 0
+    while mulai < len(sampel):
+        akhir = max(int(np.searchsorted(kumulatif, (kumulatif[mulai - 1] if mulai else 0) + blok)), mulai + 1)
+        banyak = sampel[mulai:akhir]
+        langkah = np.arange(int(banyak.sum()), dtype=np.float32)
+        langkah -= np.repeat((np.cumsum(banyak) - banyak).astype(np.float32), banyak)
+        x = np.repeat(p0[mulai:akhir, 0].astype(np.float32), banyak)
+        x += langkah * np.repeat(d[mulai:akhir, 0].astype(np.float32), banyak)
+        y = np.repeat(p0[mulai:akhir, 1].astype(np.float32), banyak)
+        y += langkah * np.repeat(d[mulai:akhir, 1].astype(np.float32), banyak)
+        bobot = None if bobot_sisi is None else np.repeat(bobot_sisi[mulai:akhir], banyak)
+        if antialias:
+            datar = np.repeat(mendatar[mulai:akhir], banyak)
+            mayor = np.where(datar, x, y) + 0.5
+            minor = np.where(datar, y, x)
+            dasar_minor = np.minimum(minor.astype(np.int32), np.where(datar, tinggi, lebar) - 2)
+            f = minor - dasar_minor
+            if bobot is not None:
+                f *= bobot
+            dasar = np.where(datar, dasar_minor * lebar + mayor.astype(np.int32),
+                             mayor.astype(np.int32) * lebar + dasar_minor)
+            buffer += np.bincount(dasar, weights=(1 if bobot is None else bobot) - f, minlength=len(buffer))
+            buffer += np.bincount(dasar + np.where(datar, lebar, 1), weights=f, minlength=len(buffer))
+        else:
+            buffer += np.bincount((y + 0.5).astype(np.int32) * lebar + (x + 0.5).astype(np.int32),
+                                  weights=bobot, minlength=len(buffer))
+        mulai = akhir
+    return buffer.reshape(tinggi, lebar)
+
+
+def bayangi(buffer, bayangan="eq_hist"):
+    if bayangan == "linear":
+        hasil = buffer.astype(float)
+    elif bayangan == "log":
+        hasil = np.log1p(buffer)
+    elif bayangan == "eq_hist":
+        isi = buffer > 0
+        nilai, hitung = np.unique(buffer[isi], return_counts=True)
+        hasil = np.zeros(buffer.shape)
+        hasil[isi] = np.cumsum(hitung)[np.searchsorted(nilai, buffer[isi])]
+    else:
+        raise ValueError(f"Bayangan '{bayangan}' tidak dikenal. Pilih: linear, log, eq_hist.")
+    puncak = hasil.max() if hasil.size else 0
+    return hasil / puncak if puncak > 0 else hasil
+
+
+def render_kepadatan(graf, berkas, metode_tata_letak="otomatis", seed=None, cache=None, ukuran=1024,
+                     bayangan="eq_hist", antialias=True, peta="inferno", posisi=None, anggaran_sampel=3 * 10 ** 7):
+    import matplotlib.image
+
+    if posisi is None:
+        posisi = tata_letak(graf, metode_tata_letak, seed=seed, cache=cache)
+    buffer = rasterkan_sisi(posisi, graf.u, graf.v, lebar=ukuran, antialias=antialias,
+                            anggaran_sampel=anggaran_sampel)
+    matplotlib.image.imsave(berkas, bayangi(buffer, bayangan), cmap=peta, vmin=0, vmax=1, origin='lower')
+    return berkas
+
+
+BATAS_SISI_VEKTOR = 100_000
+
+
+def _path_teks(teks, ukuran_font, tebal=False, geser_y=0.0):
+    from matplotlib.font_manager import FontProperties
+    from matplotlib.textpath import TextPath
+    from matplotlib.transforms import Affine2D
+
+    unik, kebalikan = np.unique(np.asarray(teks, dtype=str), return_inverse=True)
+    prop = FontProperties(weight='bold' if tebal else 'normal')
+    paths = []
+    for t in unik.tolist():
+        path = TextPath((0, 0), t, size=ukuran_font, prop=prop)
+        kotak = path.get_extents()
+        paths.append(path.transformed(Affine2D().translate(-(kotak.x0 + kotak.x1) / 2,
+                                                           geser_y - (kotak.y0 + kotak.y1) / 2)))
+    return [paths[i] for i in kebalikan.ravel().tolist()]
+
+
+def _gambar_label(ax, posisi, label, derajat, jarak_derajat=34):
+    from matplotlib.collections import PathCollection
+    from matplotlib.transforms import Affine2D
+
+    n = len(posisi)
+    paths = (_path_teks([str(x) for x in label], 12, tebal=True)
+             + _path_teks(np.char.add('d=', derajat.astype(str)), 10, geser_y=-jarak_derajat))
+    return ax.add_collection(PathCollection(
+        paths, offsets=np.concatenate((posisi, posisi)), offset_transform=ax.transData,
+        transform=Affine2D().scale(1 / 72) + ax.figure.dpi_scale_trans,
+        facecolors=['black'] * n + ['darkred'] * n, edgecolors='none', zorder=3))
+
+
+def gambar_graf(ax, graf, posisi, judul=None, agregat=False, raster=None, batas_label=200):
+    if raster is None:
+        raster = graf.jumlah_sisi > BATAS_SISI_VEKTOR
+    if raster:
+        posisi = np.asarray(posisi, dtype=float)
+        lo, hi = posisi.min(axis=0), posisi.max(axis=0)
+        buffer = rasterkan_sisi(posisi, graf.u, graf.v, antialias=True, anggaran_sampel=3 * 10 ** 7)
+        ax.imshow(bayangi(buffer), cmap='inferno', vmin=0, vmax=1, origin='lower',
+                  extent=(lo[0], hi[0], lo[1], hi[1]), interpolation='nearest')
+        if judul is not None:
+            ax.set_title(judul)
+        ax.axis('off')
+        return
+
+    posisi = np.asarray(posisi, dtype=float)
+    n = graf.jumlah_simpul
+    ukuran_simpul = 2500 if n <= batas_label else max(4.0, 2500 * batas_label / n)
+    ax.scatter(posisi[:, 0], posisi[:, 1], s=ukuran_simpul, c='crimson', zorder=2)
+    if n <= batas_label:
+        _gambar_label(ax, posisi, graf.label_simpul(), graf.derajat())
+
+    _gambar_sisi(ax, posisi, graf.u, graf.v, agregat=agregat, ukuran_simpul=ukuran_simpul)
+    if judul is not None:
+        ax.set_title(judul)
+    ax.axis('off')
+
+
+def render_graf(graf, berkas, judul="Visualisasi Graf", metode_tata_letak="otomatis", seed=None, cache=None,
+                ukuran=(12, 10), dpi=100, figur=None, agregat=False, raster=None):
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    if figur is None:
+        figur = Figure(figsize=ukuran, dpi=dpi)
+        FigureCanvasAgg(figur)
+    else:
+        figur.set_size_inches(ukuran)
+    posisi = tata_letak(graf, metode_tata_letak, seed=seed, cache=cache)
+    try:
+        gambar_graf(figur.add_subplot(), graf, posisi, judul=judul, agregat=agregat, raster=raster)
+        figur.savefig(berkas, dpi=dpi)
+    finally:
+        figur.clear()
+    return berkas
+
+
+_FIGUR_PEKERJA = None
+
+
+def _render_pekerja(graf, berkas, seed, opsi):
+    global _FIGUR_PEKERJA
+    if _FIGUR_PEKERJA is None:
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+
+        _FIGUR_PEKERJA = Figure()
+        FigureCanvasAgg(_FIGUR_PEKERJA)
+    return render_graf(graf, berkas, seed=seed, figur=_FIGUR_PEKERJA, **opsi)
+
+
+def render_banyak(daftar_graf, daftar_berkas, seed=None, pekerja=None, **opsi):
+    daftar_graf = list(daftar_graf)
+    daftar_berkas = list(daftar_berkas)
+    if len(daftar_graf) != len(daftar_berkas):
+        raise ValueError("Jumlah graf dan jumlah berkas gambar harus sama.")
+
+    seeds = pecah_seed(seed, len(daftar_graf))
+    pekerja = pekerja or os.cpu_count() or 1
+    argumen = (daftar_graf, daftar_berkas, seeds, [opsi] * len(daftar_graf))
+    ukuran = max(1, -(-len(daftar_graf) // (pekerja * 4)))
+    with ProcessPoolExecutor(max_workers=pekerja) as executor:
+        hasil = map(_render_pekerja, *argumen) if pekerja == 1 else executor.map(_render_pekerja, *argumen,
+                                                                                 chunksize=ukuran)
+        return list(hasil)
+
+
+def _batas_posisi(posisi):
+    if not len(posisi):
+        return np.zeros(2), np.zeros(2)
+    return posisi.min(axis=0), posisi.max(axis=0)
+
+
+class _IndeksGrid:
+
+    def __init__(self, posisi, eu, ev, tingkat):
+        self.tingkat = tingkat
+        self.sisi_per_sumbu = 1 << tingkat
+        self.lo, hi = _batas_posisi(posisi)
+        self.ukuran_sel = max(float((hi - self.lo).max()), 1e-12) / self.sisi_per_sumbu
+        sel = self.sel_dari(posisi)
+        self.simpul, self.awal_simpul = self._csr(sel, np.arange(len(posisi)))
+
+        self.sisi, self.awal_sisi = self._csr(sel[eu], np.arange(len(eu)))
+        selisih = posisi[eu] - posisi[ev]
+        self.panjang = np.abs(selisih).max(axis=1) if len(eu) else np.empty(0)
+
+    def sel_dari(self, titik):
+        ij = np.clip(((titik - self.lo) / self.ukuran_sel).astype(np.int64), 0, self.sisi_per_sumbu - 1)
+        return ij[:, 0] * self.sisi_per_sumbu + ij[:, 1]
+
+    def _csr(self, sel, isi):
+        urut = np.argsort(sel, kind='stable')
+        awal = np.searchsorted(sel[urut], np.arange(self.sisi_per_sumbu ** 2 + 1))
+        return isi[urut], awal
+
+    def sel_tampak(self, xmin, xmax, ymin, ymax):
+        s = self.sisi_per_sumbu
+        i0, j0 = np.clip(((np.array([xmin, ymin]) - self.lo) / self.ukuran_sel).astype(np.int64) - 1, 0, s - 1)
+        i1, j1 = np.clip(((np.array([xmax, ymax]) - self.lo) / self.ukuran_sel).astype(np.int64) + 1, 0, s - 1)
+        i, j = np.meshgrid(np.arange(i0, i1 + 1), np.arange(j0, j1 + 1), indexing='ij')
+        return (i * s + j).ravel()
+
+    def ambil(self, isi, awal, sel):
+        banyak = awal[sel + 1] - awal[sel]
+        indeks = np.repeat(awal[sel] - np.cumsum(banyak) + banyak, banyak) + np.arange(int(banyak.sum()))
+        return isi[indeks]
+
+
+class PenampilGraf:
+
+    def __init__(self, graf, posisi=None, metode_tata_letak="otomatis", seed=None, cache=None,
+                 batas_detail=5000, batas_label=200, judul="Visualisasi Graf"):
+        self.graf = graf
+        if posisi is None:
+            posisi = tata_letak(graf, metode_tata_letak, seed=seed, cache=cache)
+        self.posisi = np.asarray(posisi, dtype=float)
+        self.eu = graf.u.astype(np.int64)
+        self.ev = graf.v.astype(np.int64)
+        self.derajat = graf.derajat()
+        self.label = graf.label_simpul()
+        self.batas_detail = batas_detail
+        self.batas_label = batas_label
+        self.judul = judul
+        self._indeks = {}
+        self._ubin = {}
+        self._raster = None
+        self._sisi_panjang = []
+        self._kunci_tampilan = None
+        self.figur = self.ax = self._timer = None
+
+    def indeks(self, tingkat):
+        if tingkat not in self._indeks:
+            self._indeks[tingkat] = _IndeksGrid(self.posisi, self.eu, self.ev, tingkat)
+        return self._indeks[tingkat]
+
+    def pasang(self, ax):
+        self.ax = ax
+        self.figur = ax.figure
+        lo, hi = _batas_posisi(self.posisi)
+        tepi = 0.05 * max(float((hi - lo).max()), 1e-9)
+        ax.set_xlim(lo[0] - tepi, hi[0] + tepi)
+        ax.set_ylim(lo[1] - tepi, hi[1] + tepi)
+        ax.set_aspect('equal', adjustable='box')
+        ax.set_title(self.judul)
+        ax.axis('off')
+        ax.callbacks.connect('xlim_changed', self._tunda_perbarui)
+        ax.callbacks.connect('ylim_changed', self._tunda_perbarui)
+        self.figur.canvas.mpl_connect('scroll_event', self._gulir)
+        self.perbarui()
+
+    def _tunda_perbarui(self, _ax=None):
+        if self._timer is None:
+            self._timer = self.figur.canvas.new_timer(interval=60)
+            self._timer.single_shot = True
+            self._timer.add_callback(self._perbarui_dan_gambar)
+        self._timer.stop()
+        self._timer.start()
+
+    def _perbarui_dan_gambar(self):
+        if self.perbarui():
+            self.figur.canvas.draw_idle()
+
+    def _gulir(self, event):
+        if event.inaxes is not self.ax or event.xdata is None:
+            return
+        faktor = 1 / 1.25 if event.button == 'up' else 1.25
+        (x0, x1), (y0, y1) = self.ax.get_xlim(), self.ax.get_ylim()
+        self.ax.set_xlim(event.xdata + (x0 - event.xdata) * faktor, event.xdata + (x1 - event.xdata) * faktor)
+        self.ax.set_ylim(event.ydata + (y0 - event.ydata) * faktor, event.ydata + (y1 - event.ydata) * faktor)
+        self.figur.canvas.draw_idle()
+
+    def _hapus(self, artis):
+        for a in artis:
+            a.remove()
+
+    def _kosongkan(self):
+        for artis in self._ubin.values():
+            self._hapus(artis)
+        self._ubin = {}
+        self._hapus(self._sisi_panjang)
+        self._sisi_panjang = []
+        if self._raster is not None:
+            self._raster.remove()
+            self._raster = None
+
+    def perbarui(self):
+        (xmin, xmax), (ymin, ymax) = self.ax.get_xlim(), self.ax.get_ylim()
+        lebar_tampak = max(xmax - xmin, ymax - ymin, 1e-12)
+        jangkau = max(float(np.ptp(self.posisi, axis=0).max()) if len(self.posisi) else 0.0, 1e-12)
+        tingkat = int(np.clip(np.ceil(np.log2(jangkau / lebar_tampak)) + 2, 0, 12))
+        indeks = self.indeks(tingkat)
+        sel = indeks.sel_tampak(xmin, xmax, ymin, ymax)
+        perkiraan = int((indeks.awal_sisi[sel + 1] - indeks.awal_sisi[sel]).sum())
+        mode = "agregat" if perkiraan > self.batas_detail else "detail"
+
+        if mode == "agregat":
+            kunci = (mode, xmin, xmax, ymin, ymax)
+            if kunci == self._kunci_tampilan:
+                return False
+            self._kosongkan()
+            self._kunci_tampilan = kunci
+            piksel = self.ax.get_window_extent()
+            buffer = rasterkan_sisi(self.posisi, self.eu, self.ev, lebar=max(int(piksel.width), 2),
+                                    tinggi=max(int(piksel.height), 2), antialias=True,
+                                    anggaran_sampel=2 * 10 ** 7, batas=(xmin, xmax, ymin, ymax))
+            self._raster = self.ax.imshow(bayangi(buffer), cmap='inferno', vmin=0, vmax=1, origin='lower',
+                                          extent=(xmin, xmax, ymin, ymax), interpolation='nearest',
+                                          zorder=0)
+            self.ax.set_xlim(xmin, xmax)
+            self.ax.set_ylim(ymin, ymax)
+            return True
+
+        label = len(indeks.ambil(indeks.simpul, indeks.awal_simpul, sel)) <= self.batas_label
+        if self._kunci_tampilan != (mode, tingkat, label):
+            self._kosongkan()
+        self._kunci_tampilan = (mode, tingkat, label)
+        baru = [int(c) for c in sel.tolist() if c not in self._ubin]
+        lama = set(self._ubin) - set(sel.tolist())
+        for c in lama:
+            self._hapus(self._ubin.pop(c))
+        for c in baru:
+            self._ubin[c] = self._gambar_ubin(indeks, c, label)
+
+        self._hapus(self._sisi_panjang)
+        panjang = np.flatnonzero(indeks.panjang > indeks.ukuran_sel)
+        if len(panjang):
+            p0, p1 = self.posisi[self.eu[panjang]], self.posisi[self.ev[panjang]]
+            potong = (np.minimum(p0[:, 0], p1[:, 0]) <= xmax) & (np.maximum(p0[:, 0], p1[:, 0]) >= xmin) & \
+                     (np.minimum(p0[:, 1], p1[:, 1]) <= ymax) & (np.maximum(p0[:, 1], p1[:, 1]) >= ymin)
+            panjang = panjang[potong][:self.batas_detail]
+        self._sisi_panjang = _gambar_sisi(self.ax, self.posisi, self.eu[panjang], self.ev[panjang],
+                                          lebar=0.6, autoskala=False)
+        return bool(baru or lama or len(panjang))
+
+    def _gambar_ubin(self, indeks, sel, label):
+        sel = np.array([sel])
+        simpul = indeks.ambil(indeks.simpul, indeks.awal_simpul, sel)
+        sisi = indeks.ambil(indeks.sisi, indeks.awal_sisi, sel)
+        sisi = sisi[indeks.panjang[sisi] <= indeks.ukuran_sel]
+        ukuran = 400 if label else 30
+        artis = _gambar_sisi(self.ax, self.posisi, self.eu[sisi], self.ev[sisi], lebar=0.8, autoskala=False,
+                             ukuran_simpul=ukuran)
+        if len(simpul):
+            artis.append(self.ax.scatter(self.posisi[simpul, 0], self.posisi[simpul, 1], s=ukuran, c='crimson',
+                                         zorder=2))
+            if label:
+                artis.append(_gambar_label(self.ax, self.posisi[simpul], [self.label[i] for i in simpul.tolist()],
+                                           self.derajat[simpul], jarak_derajat=16))
+        return artis
+
+    def tampilkan(self):
+        import matplotlib.pyplot as plt
+
+        figur = plt.figure(figsize=(12, 10))
+        try:
+            self.pasang(figur.add_subplot())
+            plt.show()
+        finally:
+            plt.close(figur)
+
+
+def _nama_berkas_ke(berkas, i, jumlah):
+    akar, akhiran = os.path.splitext(berkas)
+    if akhiran in ('.gz', '.bz2', '.xz'):
+        akar, akhiran = os.path.splitext(akar)[0], os.path.splitext(akar)[1] + akhiran
+    return f"{akar}_{i:0{len(str(jumlah - 1))}d}{akhiran}"
+
 
 class VisualisasiGraf:
 
-    def __init__(self):
+    def __init__(self, seed=None, metode_tata_letak="otomatis", cache_tata_letak=None, keluaran_gambar=None,
+                 agregat=False, interaktif=False, maks_ganda=2, izinkan_loop=True):
+        self.metode_tata_letak = metode_tata_letak
+        self.maks_ganda = maks_ganda
+        self.izinkan_loop = izinkan_loop
+        self.agregat = agregat
+        self.interaktif = interaktif
+        self.keluaran_gambar = keluaran_gambar
+        self.cache_tata_letak = cache_tata_letak or CacheTataLetak()
         self.simpul = []
-        self.derajat_awal = {}
-        self.graf = nx.MultiGraph()
+        self.derajat_awal = HistogramDerajat([], [])
+        self.graf = GrafKompak()
+        self.rng_graf, self.rng_layout = (np.random.default_rng(s) for s in pecah_seed(seed, 2))
 
     def _input_int(self, pertanyaan, min_val=0):
         while True:
@@ -21,77 +2183,290 @@ class VisualisasiGraf:
             except ValueError:
                 print("Input tidak valid. Harap masukkan angka int.")
 
+    def _input_derajat(self, pertanyaan):
+        while True:
+            teks = input(pertanyaan).strip()
+            try:
+                if os.path.isfile(teks):
+                    with open(teks, 'rb') as berkas:
+                        derajat = baca_histogram(berkas)
+                else:
+                    derajat = urai_histogram(teks)
+            except ValueError as e:
+                print(f"Input tidak valid. {e}")
+                continue
+            if len(derajat):
+                return derajat
+            print("Masukkan minimal satu derajat.")
+
     def _visualisasikan(self, judul="Visualisasi Graf"):
         print("\nMencetak...")
-        pos = nx.spring_layout(self.graf)
-        plt.figure(figsize=(12, 10))
-        ax = plt.gca()
+        if self.keluaran_gambar is not None:
+            render_graf(self.graf, self.keluaran_gambar, judul=judul, metode_tata_letak=self.metode_tata_letak,
+                        seed=self.rng_layout, cache=self.cache_tata_letak, agregat=self.agregat)
+            print(f"Visualisasi disimpan ke {self.keluaran_gambar}.")
+            return
+
+        posisi = tata_letak(self.graf, self.metode_tata_letak, seed=self.rng_layout, cache=self.cache_tata_letak)
+        if self.interaktif:
+            PenampilGraf(self.graf, posisi, judul=judul).tampilkan()
+            print("Visualisasi selesai ditampilkan.")
+            return
 
-        nx.draw_networkx_nodes(self.graf, pos, ax=ax, node_color='crimson', node_size=2500)
-        nx.draw_networkx_labels(self.graf, pos, ax=ax, font_size=12, font_weight='bold')
+        import matplotlib.pyplot as plt
 
+        figur = plt.figure(figsize=(12, 10))
         try:
-            labels = {n: f'd={self.graf.degree(n)}' for n in self.graf.nodes()}
-            label_pos = {k: (v[0], v[1] - 0.12) for k, v in pos.items()}
-            nx.draw_networkx_labels(self.graf, label_pos, labels=labels, font_size=10, font_color='darkred')
-        except Exception as e:
-            print(f"Gagal menggambar label derajat: {e}")
-
-        edge_groups = defaultdict(list)
-        for u, v in self.graf.edges():
-            edge_groups[tuple(sorted((u, v)))].append((u, v))
-
-        for (u, v), edges in edge_groups.items():
-            if u == v:
-                for i, e in enumerate(edges):
-                    rad = 0.1 + (i * 0.1)
-                    nx.draw_networkx_edges(self.graf, pos, edgelist=[e], ax=ax, connectionstyle=f'arc3,rad={rad}')
-            elif len(edges) <= 2:
-                for i, e in enumerate(edges):
-                    rad = -0.1 + i * 0.2
-                    nx.draw_networkx_edges(self.graf, pos, edgelist=[e], ax=ax, connectionstyle=f'arc3,rad={rad}')
-
-        plt.title(judul)
-        plt.axis('off')
-        plt.show()
+            gambar_graf(figur.add_subplot(), self.graf, posisi, judul=judul, agregat=self.agregat)
+            plt.show()
+        finally:
+            plt.close(figur)
         print("Visualisasi selesai ditampilkan.")
 
-    def _graf_bebas(self):
+    def _graf_bebas(self, metode="numpy", maks_ulang=20):
         print("\n--- Membuat Graf tak Berarah ---")
-        stubs = [node for node, deg in self.derajat_awal.items() for _ in range(deg)]
-        random.shuffle(stubs)
-        edge_counts = defaultdict(int)
-
-        while len(stubs) > 1:
-            u = stubs.pop()
-            v = stubs.pop()
-            key = tuple(sorted((u, v)))
-
-            if u == v or edge_counts[key] < 2:
-                self.graf.add_edge(u, v)
-                edge_counts[key] += 1
-            else:
-                stubs.extend([u, v])
-                random.shuffle(stubs)
+        try:
+            graf = buat_graf(self.derajat_awal, seed=self.rng_graf, metode=metode, maks_ulang=maks_ulang,
+                             maks_ganda=self.maks_ganda, izinkan_loop=self.izinkan_loop)
+        except ValueError as e:
+            print(f"[Error] {e}")
+            return
 
+        graf.label = self.simpul
+        self.graf = graf
         self._visualisasikan("===== Graf Dibuat =====")
 
+    def _graf_havel_hakimi(self):
+        print("\n--- Membuat Graf Sederhana (Havel-Hakimi) ---")
+        try:
+            graf = buat_graf(self.derajat_awal, metode="havel_hakimi", maks_ganda=self.maks_ganda,
+                             izinkan_loop=self.izinkan_loop)
+        except ValueError as e:
+            print(f"[Error] {e}")
+            return
+
+        graf.label = self.simpul
+        self.graf = graf
+        self._visualisasikan("===== Graf Havel-Hakimi =====")
+
+    def _graf_dengan_syarat(self):
+        print("\n--- Membuat Graf Dengan Syarat ---")
+        jumlah_loop = self._input_int("Masukkan jumlah loop yang diinginkan: ")
+        jumlah_ganda = self._input_int("Masukkan jumlah sisi ganda yang diinginkan: ")
+        try:
+            graf = buat_graf(self.derajat_awal, seed=self.rng_graf, metode="syarat",
+                             jumlah_loop=jumlah_loop, jumlah_ganda=jumlah_ganda,
+                             maks_ganda=self.maks_ganda, izinkan_loop=self.izinkan_loop)
+        except ValueError as e:
+            print(f"[Error] {e}")
+            return
+
+        print("Peringatan: tahap pelengkap bisa menambah loop atau sisi ganda acak agar derajat terpenuhi.")
+        graf.label = self.simpul
+        self.graf = graf
+        self._visualisasikan("===== Graf Dengan Syarat =====")
+
+    def _graf_syarat_tepat(self):
+        print("\n--- Membuat Graf Dengan Jumlah Loop & Sisi Ganda Tepat ---")
+        jumlah_loop = self._input_int("Masukkan jumlah loop: ")
+        jumlah_ganda = self._input_int("Masukkan jumlah sisi ganda: ")
+        try:
+            graf = buat_graf(self.derajat_awal, seed=self.rng_graf, metode="syarat_tepat",
+                             jumlah_loop=jumlah_loop, jumlah_ganda=jumlah_ganda,
+                             maks_ganda=self.maks_ganda, izinkan_loop=self.izinkan_loop)
+        except ValueError as e:
+            print(f"[Error] {e}")
+            return
+
+        graf.label = self.simpul
+        self.graf = graf
+        self._visualisasikan(f"===== Graf: {jumlah_loop} Loop, {jumlah_ganda} Sisi Ganda =====")
+
     def run(self):
         print("===== Program Visualisasi Graf tak Berarah =====")
-        jumlah_simpul = self._input_int("Masukkan jumlah simpul: ", min_val=1)
-        self.simpul = [str(i) for i in range(1, jumlah_simpul + 1)]
-        self.graf.add_nodes_from(self.simpul)
-
         print("\n--- Input Derajat Simpul ---")
-        for s in self.simpul:
-            self.derajat_awal[s] = self._input_int(f"Derajat simpul {s}: ")
+        print("Tulis semua derajat dalam satu baris (mis. '3 3 2' atau '1000x3 500x4'), atau path berkas.")
+        self.derajat_awal = self._input_derajat("Derajat: ")
+        self.simpul = range(1, len(self.derajat_awal) + 1)
+        self.graf = GrafKompak(len(self.derajat_awal), label=self.simpul)
+        print(format_statistik(self.derajat_awal.statistik()))
 
-        if sum(self.derajat_awal.values()) % 2 != 0:
-            print("[Error] Total derajat ganjil. Tidak bisa buat graf.")
+        alasan = alasan_tidak_grafis(self.derajat_awal, maks_ganda=self.maks_ganda, izinkan_loop=self.izinkan_loop)
+        if alasan is not None:
+            print(f"[Error] {alasan}")
             return
 
-        self._graf_bebas()
+        print("\nPilih metode pembuatan graf:")
+        loop = "dengan loop" if self.izinkan_loop else "tanpa loop"
+        batas = "tanpa batas sisi paralel" if self.maks_ganda is None else f"maksimal {self.maks_ganda} sisi paralel"
+        print(f"1. Acak ({loop}, {batas})")
+        print("2. Deterministik Havel-Hakimi (graf sederhana)")
+        print("3. Acak hampir seragam (tukar sisi MCMC)")
+        print("4. Dengan syarat (menentukan jumlah loop & sisi ganda)")
+        print("5. Dengan syarat tepat (jumlah loop & sisi ganda persis)")
+        pilihan = ""
+        while pilihan not in ['1', '2', '3', '4', '5']:
+            pilihan = input("Masukkan pilihan (1-5): ").strip()
+
+        if pilihan == '1':
+            self._graf_bebas()
+        elif pilihan == '2':
+            self._graf_havel_hakimi()
+        elif pilihan == '3':
+            self._graf_bebas(metode="mcmc")
+        elif pilihan == '4':
+            self._graf_dengan_syarat()
+        else:
+            self._graf_syarat_tepat()
+
+
+def _main_gambar(args, derajat, maks_ganda):
+    cache = CacheTataLetak(direktori=args.cache_tata_letak)
+    if args.jumlah <= 1:
+        graf = buat_graf(derajat, seed=args.seed, maks_ganda=maks_ganda, metode=args.metode,
+                         faktor_campur=args.faktor_campur, jumlah_loop=args.jumlah_loop,
+                         jumlah_ganda=args.jumlah_ganda, izinkan_loop=not args.tanpa_loop)
+        render_graf(graf, args.gambar, metode_tata_letak=args.tata_letak, seed=args.seed, cache=cache,
+                    agregat=args.agregat, raster=args.raster)
+        if args.output is not None:
+            with _buka_keluaran(args.output, args.format == "bin") as berkas:
+                graf.tulis_daftar_sisi(berkas, format=args.format)
+        return 0
+
+    sampel = buat_ensembel(derajat, args.jumlah, seed=args.seed, maks_ganda=maks_ganda, metode=args.metode,
+                           pekerja=args.pekerja, izinkan_loop=not args.tanpa_loop, faktor_campur=args.faktor_campur,
+                           jumlah_loop=args.jumlah_loop, jumlah_ganda=args.jumlah_ganda)
+    daftar_graf = []
+    for i, sisi in enumerate(sampel):
+        graf = GrafKompak(len(derajat))
+        graf.tambah_sisi_banyak(sisi)
+        daftar_graf.append(graf)
+        if args.output is not None:
+            with _buka_keluaran(_nama_berkas_ke(args.output, i, args.jumlah), args.format == "bin") as berkas:
+                graf.tulis_daftar_sisi(berkas, format=args.format)
+    berkas = [_nama_berkas_ke(args.gambar, i, args.jumlah) for i in range(args.jumlah)]
+    render_banyak(daftar_graf, berkas, seed=args.seed, pekerja=args.pekerja,
+                  metode_tata_letak=args.tata_letak, cache=cache, agregat=args.agregat, raster=args.raster)
+    return 0
+
+
+def _int_tak_negatif(teks):
+    nilai = int(teks)
+    if nilai < 0:
+        raise argparse.ArgumentTypeError(f"harus bilangan bulat >= 0, bukan {teks}")
+    return nilai
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Membuat graf tak berarah dari barisan derajat.")
+    parser.add_argument("--derajat", metavar="BERKAS",
+                        help="baca barisan derajat dari berkas ('-' untuk stdin) tanpa prompt dan tanpa visualisasi")
+    parser.add_argument("-o", "--output", default=None,
+                        help="berkas daftar sisi ('-' untuk stdout, bawaan bila tanpa --gambar); "
+                             "akhiran .gz/.bz2/.xz dikompresi")
+    parser.add_argument("--format", choices=["tsv", "bin"], default="tsv",
+                        help="tsv: label simpul mulai 1; bin: pasangan int32 little-endian, id mulai 0")
+    parser.add_argument("--alir", action="store_true",
+                        help="tulis sisi langsung saat dipasangkan tanpa menyimpan graf di memori; simpul "
+                             "dipasangkan satu per satu menurut derajat sehingga memori hanya O(jumlah simpul); "
+                             "4096 sisi terakhir dibangun di memori")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--metode", choices=METODE_GRAF,
+                        default="numpy",
+                        help="havel_hakimi membangun graf sederhana secara deterministik; "
+                             "mcmc mengacak realisasi awal dengan tukar sisi hingga hampir seragam atas multigraf; "
+                             "syarat/syarat_tepat memakai --jumlah-loop dan --jumlah-ganda; syarat_tepat menghitung "
+                             "sisi ganda sebagai pasangan dengan tepat 2 sisi paralel sehingga --maks-ganda harus 1 "
+                             "atau 2")
+    parser.add_argument("--jumlah-loop", type=_int_tak_negatif, default=0)
+    parser.add_argument("--jumlah-ganda", type=_int_tak_negatif, default=0)
+    parser.add_argument("--faktor-campur", type=int, default=10,
+                        help="jumlah percobaan tukar sisi per sisi untuk metode mcmc")
+    parser.add_argument("--maks-ganda", type=int, default=2,
+                        help="batas sisi paralel per pasangan simpul; 1 untuk graf sederhana, 0 untuk tanpa batas")
+    parser.add_argument("--tanpa-loop", action="store_true", help="larang loop pada metode acak")
+    parser.add_argument("--tata-letak", choices=["otomatis", *METODE_TATA_LETAK], default="otomatis",
+                        help="metode tata letak untuk visualisasi interaktif")
+    parser.add_argument("--cache-tata-letak", metavar="DIREKTORI",
+                        help="simpan tata letak di direktori ini agar graf yang sama tidak dihitung ulang")
+    parser.add_argument("--gambar", metavar="BERKAS",
+                        help="simpan visualisasi ke berkas .png/.svg/.pdf tanpa membuka jendela")
+    parser.add_argument("--agregat", action="store_true",
+                        help="gambar satu garis per pasangan simpul dengan tebal, warna dan angka sesuai jumlah sisi")
+    parser.add_argument("--raster", action="store_true", default=None,
+                        help="gambar kepadatan sisi sebagai citra piksel; otomatis di atas "
+                             f"{BATAS_SISI_VEKTOR} sisi")
+    parser.add_argument("--interaktif", action="store_true",
+                        help="buka penampil yang bisa di-zoom dan digeser; hanya bagian yang tampak yang digambar")
+    parser.add_argument("--jumlah", type=int, default=1,
+                        help="buat dan gambar sejumlah sampel; nama berkas --gambar dan -o diberi nomor urut")
+    parser.add_argument("--pekerja", type=int, default=None, help="jumlah proses untuk --jumlah > 1")
+    parser.add_argument("--statistik", action="store_true",
+                        help="cetak ringkasan histogram derajat dan kelayakannya tanpa membuat graf")
+    args = parser.parse_args(argv)
+    if args.jumlah > 1 and args.output == '-':
+        parser.error("--jumlah > 1 menulis satu berkas per sampel; -o tidak boleh '-'")
+    if args.maks_ganda < 0:
+        parser.error("--maks-ganda tidak boleh negatif; pakai 0 untuk tanpa batas")
+    if args.alir and args.interaktif:
+        parser.error("--alir tidak menyimpan graf di memori; tidak dapat digabung dengan --interaktif")
+    if args.alir:
+        diabaikan = [opsi for opsi, nama in (("--metode", "metode"), ("--jumlah-loop", "jumlah_loop"),
+                                              ("--jumlah-ganda", "jumlah_ganda"), ("--faktor-campur", "faktor_campur"))
+                     if getattr(args, nama) != parser.get_default(nama)]
+        if diabaikan:
+            parser.error(f"--alir selalu memasangkan stub acak; tidak dapat digabung dengan {', '.join(diabaikan)}")
+
+    if args.derajat is None:
+        program_graf = VisualisasiGraf(seed=args.seed, metode_tata_letak=args.tata_letak,
+                                       cache_tata_letak=CacheTataLetak(direktori=args.cache_tata_letak),
+                                       keluaran_gambar=args.gambar, agregat=args.agregat,
+                                       interaktif=args.interaktif, maks_ganda=args.maks_ganda or None,
+                                       izinkan_loop=not args.tanpa_loop)
+        program_graf.run()
+        return 0
+
+    try:
+        if args.derajat == '-':
+            derajat = baca_histogram(sys.stdin)
+        else:
+            with open(args.derajat) as berkas:
+                derajat = baca_histogram(berkas)
+    except ValueError as e:
+        print(f"[Error] {e}", file=sys.stderr)
+        return 1
+
+    maks_ganda = args.maks_ganda or None
+    if args.statistik:
+        print(format_statistik(derajat.statistik()))
+        alasan = alasan_tidak_grafis(derajat, maks_ganda=maks_ganda, izinkan_loop=not args.tanpa_loop)
+        print("Dapat direalisasikan." if alasan is None else f"Tidak dapat direalisasikan: {alasan}")
+        return 0 if alasan is None else 1
+
+    if args.output is None and args.gambar is None and not args.interaktif:
+        args.output = '-'
+    try:
+        if args.gambar is not None:
+            return _main_gambar(args, derajat, maks_ganda)
+        if args.alir:
+            sisi = alirkan_sisi(derajat, seed=args.seed, maks_ganda=maks_ganda, izinkan_loop=not args.tanpa_loop)
+            with _buka_keluaran(args.output, args.format == "bin") as berkas:
+                tulis_aliran_sisi(sisi, berkas, format=args.format)
+        else:
+            graf = buat_graf(derajat, seed=args.seed, maks_ganda=maks_ganda, metode=args.metode,
+                             faktor_campur=args.faktor_campur, jumlah_loop=args.jumlah_loop,
+                             jumlah_ganda=args.jumlah_ganda, izinkan_loop=not args.tanpa_loop)
+            if args.output is not None:
+                with _buka_keluaran(args.output, args.format == "bin") as berkas:
+                    graf.tulis_daftar_sisi(berkas, format=args.format)
+            if args.interaktif:
+                PenampilGraf(graf, metode_tata_letak=args.tata_letak, seed=args.seed,
+                             cache=CacheTataLetak(direktori=args.cache_tata_letak)).tampilkan()
+    except ValueError as e:
+        print(f"[Error] {e}", file=sys.stderr)
+        return 1
+    return 0
+
 
 if __name__ == '__main__':
-    program_graf = VisualisasiGraf()
-    program_graf.run()
+    sys.exit(main())
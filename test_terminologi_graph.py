@@ -0,0 +1,548 @@
+import collections
+import itertools
+import os
+import subprocess
+import sys
+import tracemalloc
+
+import numpy as np
+import pytest
+
+import terminologi_graph
+from terminologi_graph import (METODE_TATA_LETAK, CacheTataLetak, GrafKompak, PenampilGraf, alasan_tidak_grafis,
+                               alirkan_sisi, buat_ensembel, buat_graf, main, rasterkan_sisi, render_graf,
+                               sampel_tukar_sisi, tata_letak, urai_histogram)
+
+
+def _semua_multigraf(n):
+    pasangan = list(itertools.combinations(range(n), 2))
+    ganda = np.array(list(itertools.product((0, 1, 2), repeat=len(pasangan))), dtype=np.int64)
+    ganda = ganda.reshape(3 ** len(pasangan), len(pasangan))
+    insiden = np.zeros((len(pasangan), n), dtype=np.int64)
+    for i, (a, b) in enumerate(pasangan):
+        insiden[i, a] = insiden[i, b] = 1
+    return ganda @ insiden, (ganda == 2).sum(axis=1)
+
+
+_MULTIGRAF = {n: _semua_multigraf(n) for n in range(1, 6)}
+
+
+def _bisa_dicapai(derajat):
+    d = np.array(derajat)
+    w, jumlah_ganda = _MULTIGRAF[len(d)]
+    cocok = ((w <= d) & ((d - w) % 2 == 0)).all(axis=1)
+    loop = ((d - w[cocok]) // 2).sum(axis=1)
+    return set(zip(loop.tolist(), jumlah_ganda[cocok].tolist()))
+
+
+def _barisan_kecil():
+    for n in range(1, 6):
+        for d in itertools.combinations_with_replacement(range(5 if n == 5 else 6), n):
+            if sum(d) % 2 == 0:
+                yield list(d)[::-1]
+
+
+def _chungphaisan_per_r(derajat, k):
+    d = sorted(derajat, reverse=True)
+    for r in range(1, len(d) + 1):
+        if sum(d[:r]) > k * r * (r - 1) + sum(min(k * r, x) for x in d[r:]):
+            return False
+    return True
+
+
+def _periksa_realisasi(sisi, derajat, maks_ganda, izinkan_loop, jumlah_loop=None, jumlah_ganda=None):
+    sisi = np.asarray(sisi).reshape(-1, 2)
+    assert (np.bincount(sisi.ravel(), minlength=len(derajat)) == derajat).all()
+    loop = sisi[:, 0] == sisi[:, 1]
+    if not izinkan_loop:
+        assert not loop.any()
+    if jumlah_loop is not None:
+        assert loop.sum() == jumlah_loop
+    hitung = collections.Counter(map(tuple, np.sort(sisi[~loop], axis=1).tolist()))
+    if maks_ganda is not None:
+        assert max(hitung.values(), default=0) <= maks_ganda
+    if jumlah_ganda is not None:
+        assert sum(v == 2 for v in hitung.values()) == jumlah_ganda
+
+
+@pytest.mark.parametrize("derajat", list(_barisan_kecil()), ids=str)
+def test_syarat_tepat_sesuai_pencarian_menyeluruh(derajat):
+    tercapai = _bisa_dicapai(derajat)
+    for jumlah_loop in range(sum(derajat) // 2 + 1):
+        for jumlah_ganda in range(sum(derajat) // 4 + 1):
+            try:
+                graf = buat_graf(derajat, metode="syarat_tepat", jumlah_loop=jumlah_loop,
+                                 jumlah_ganda=jumlah_ganda, seed=1)
+            except ValueError:
+                assert (jumlah_loop, jumlah_ganda) not in tercapai
+                continue
+            assert (jumlah_loop, jumlah_ganda) in tercapai
+            _periksa_realisasi(graf.sisi(), derajat, 2, True, jumlah_loop, jumlah_ganda)
+
+
+def _tanam_syarat(rng):
+    n = int(rng.integers(6, 60))
+    kepadatan = rng.uniform(0.3, 1.0)
+    peluang_ganda = rng.uniform(0.3, 0.95)
+    derajat = np.zeros(n, dtype=np.int64)
+    jumlah_ganda = 0
+    for a, b in itertools.combinations(range(n), 2):
+        if rng.random() < kepadatan:
+            kali = 2 if rng.random() < peluang_ganda else 1
+            derajat[a] += kali
+            derajat[b] += kali
+            jumlah_ganda += kali == 2
+    jumlah_loop = int(rng.integers(0, 6))
+    np.add.at(derajat, rng.integers(0, n, jumlah_loop), 2)
+    return derajat, jumlah_loop, jumlah_ganda
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_syarat_tepat_realisasi_tertanam_padat(seed):
+    rng = np.random.default_rng(seed)
+    for i in range(25):
+        derajat, jumlah_loop, jumlah_ganda = _tanam_syarat(rng)
+        graf = buat_graf(derajat, metode="syarat_tepat", jumlah_loop=jumlah_loop, jumlah_ganda=jumlah_ganda, seed=i)
+        _periksa_realisasi(graf.sisi(), derajat, 2, True, jumlah_loop, jumlah_ganda)
+
+
+@pytest.mark.parametrize("derajat", list(_barisan_kecil()), ids=str)
+def test_kelayakan_tanpa_loop_sesuai_pencarian_menyeluruh(derajat):
+    ada = any(loop == 0 for loop, _ in _bisa_dicapai(derajat))
+    assert (alasan_tidak_grafis(derajat, maks_ganda=2, izinkan_loop=False) is None) == ada
+
+
+def test_kelayakan_sesuai_chungphaisan_per_r():
+    rng = np.random.default_rng(7)
+    for _ in range(3000):
+        n = int(rng.integers(1, 12))
+        derajat = rng.integers(0, int(rng.integers(1, 15)), n)
+        if derajat.sum() % 2:
+            derajat[0] += 1
+        for k in (1, 2, 3, 4):
+            harapan = _chungphaisan_per_r(derajat.tolist(), k)
+            assert (alasan_tidak_grafis(derajat, maks_ganda=k, izinkan_loop=False) is None) == harapan, (derajat, k)
+
+
+def test_kelayakan_sederhana_sesuai_networkx():
+    nx = pytest.importorskip("networkx")
+    rng = np.random.default_rng(11)
+    for _ in range(2000):
+        derajat = rng.integers(0, 10, int(rng.integers(1, 12)))
+        if derajat.sum() % 2 == 0:
+            assert (alasan_tidak_grafis(derajat, maks_ganda=1, izinkan_loop=False) is None) == \
+                nx.is_graphical(derajat.tolist())
+
+
+@pytest.mark.parametrize("metode", ["numpy", "mcmc"])
+def test_ensembel_bentuk_realisasi_dan_tak_bergantung_pekerja(metode):
+    derajat = [4, 3, 3, 2, 2, 2]
+    satu = buat_ensembel(derajat, 6, seed=7, metode=metode, pekerja=1)
+    assert satu.shape == (6, 8, 2) and satu.dtype == np.int32
+    for sampel in satu:
+        _periksa_realisasi(sampel, derajat, 2, True)
+    assert np.array_equal(satu, buat_ensembel(derajat, 6, seed=7, metode=metode, pekerja=2))
+
+
+def test_havel_hakimi_merealisasikan_barisan_grafis_networkx():
+    nx = pytest.importorskip("networkx")
+    rng = np.random.default_rng(13)
+    diuji = 0
+    for _ in range(2000):
+        derajat = rng.integers(0, 10, int(rng.integers(1, 12)))
+        if not nx.is_graphical(derajat.tolist()):
+            continue
+        graf = buat_graf(derajat, metode="havel_hakimi")
+        _periksa_realisasi(np.column_stack([graf.u, graf.v]), derajat, 1, False)
+        diuji += 1
+    assert diuji > 100
+
+
+@pytest.mark.parametrize("metode", ["numpy", "stub", "mcmc"])
+def test_barisan_lolos_uji_selalu_terealisasi(metode):
+    kasus = [([1998] + [2] * 999, 2, False), ([6, 6], 1, True), ([6, 4], 1, True), ([58] * 60, 1, False)]
+    rng = np.random.default_rng(5)
+    for _ in range(300):
+        derajat = rng.integers(0, int(rng.integers(1, 12)), int(rng.integers(1, 10)))
+        if derajat.sum() % 2:
+            derajat[0] += 1
+        kasus += [(derajat, k, loop) for k in (1, 2, None) for loop in (False, True)]
+    for seed, (derajat, maks_ganda, izinkan_loop) in enumerate(kasus):
+        derajat = np.asarray(derajat)
+        if alasan_tidak_grafis(derajat, maks_ganda=maks_ganda, izinkan_loop=izinkan_loop) is not None:
+            continue
+        graf = buat_graf(derajat, seed=seed, maks_ganda=maks_ganda, metode=metode, izinkan_loop=izinkan_loop)
+        _periksa_realisasi(graf.sisi(), derajat, maks_ganda, izinkan_loop)
+
+
+@pytest.mark.parametrize("maks_ganda", [1, 2, 3])
+def test_aliran_tanpa_loop_memenuhi_derajat_dan_batas(maks_ganda):
+    kasus = [[1, 3, 4, 2, 2], [6, 4, 4, 2], [3] * 5000, [40] * 300]
+    rng = np.random.default_rng(13)
+    for _ in range(500):
+        derajat = rng.integers(0, int(rng.integers(1, 10)), int(rng.integers(2, 10)))
+        if derajat.sum() % 2:
+            derajat[0] += 1
+        kasus.append(derajat)
+    for seed, derajat in enumerate(kasus):
+        derajat = np.asarray(derajat)
+        if alasan_tidak_grafis(derajat, maks_ganda=maks_ganda, izinkan_loop=False) is not None:
+            continue
+        sisi = np.array(list(alirkan_sisi(derajat, seed=seed, maks_ganda=maks_ganda, izinkan_loop=False)),
+                        dtype=np.int64).reshape(-1, 2)
+        _periksa_realisasi(sisi, derajat, maks_ganda, False)
+
+
+def test_kolom_graf_hanya_baca_dan_tetap_bisa_ditambah():
+    graf = GrafKompak(3)
+    graf.tambah_sisi(0, 1)
+    u, v = graf.u, graf.v
+    graf.tambah_sisi(1, 2)
+    graf.tambah_sisi_banyak([[2, 0]] * 40)
+    assert u.tolist() == [0] and v.tolist() == [1]
+    assert graf.jumlah_sisi == 42 and (graf.derajat() == [41, 2, 41]).all()
+    graf.csr()
+    with pytest.raises(ValueError):
+        graf.u[0] = 2
+    assert graf._csr is not None and graf.sisi()[0].tolist() == [0, 1]
+
+
+def test_cli_menolak_maks_ganda_negatif(tmp_path, capsys):
+    berkas = tmp_path / "derajat.txt"
+    berkas.write_text("2 2")
+    with pytest.raises(SystemExit) as keluar:
+        main(["--derajat", str(berkas), "--maks-ganda", "-1", "--statistik"])
+    assert keluar.value.code == 2
+    assert "--maks-ganda" in capsys.readouterr().err
+
+
+def test_cli_menolak_alir_interaktif(tmp_path, capsys):
+    berkas = tmp_path / "derajat.txt"
+    berkas.write_text("2 2")
+    with pytest.raises(SystemExit) as keluar:
+        main(["--derajat", str(berkas), "--alir", "--interaktif"])
+    assert keluar.value.code == 2
+    assert "--interaktif" in capsys.readouterr().err
+
+
+@pytest.mark.parametrize("opsi", [["--metode", "mcmc"], ["--jumlah-loop", "1"], ["--jumlah-ganda", "1"],
+                                  ["--faktor-campur", "3"]])
+def test_cli_menolak_alir_dengan_opsi_yang_diabaikan(tmp_path, capsys, opsi):
+    berkas = tmp_path / "derajat.txt"
+    berkas.write_text("2 2")
+    with pytest.raises(SystemExit) as keluar:
+        main(["--derajat", str(berkas), "--alir", *opsi])
+    assert keluar.value.code == 2
+    assert opsi[0] in capsys.readouterr().err
+
+
+@pytest.mark.parametrize("pilihan", ["1", "2", "3"])
+def test_cli_menu_mematuhi_maks_ganda_dan_tanpa_loop(tmp_path, monkeypatch, pilihan):
+    masukan = iter(["3 3 2 2 2", pilihan])
+    tergambar = []
+    monkeypatch.setattr("builtins.input", lambda *_: next(masukan))
+    monkeypatch.setattr(terminologi_graph, "render_graf", lambda graf, *a, **k: tergambar.append(graf))
+    assert main(["--maks-ganda", "1", "--tanpa-loop", "--seed", "0", "--gambar", str(tmp_path / "g.png")]) == 0
+    graf, = tergambar
+    _periksa_realisasi(np.column_stack([graf.u, graf.v]), [3, 3, 2, 2, 2], 1, False)
+
+
+@pytest.mark.parametrize("metode", ["syarat", "syarat_tepat"])
+@pytest.mark.parametrize("opsi", [{"jumlah_loop": -1}, {"jumlah_ganda": -1}])
+def test_jumlah_syarat_negatif_ditolak(metode, opsi):
+    with pytest.raises(ValueError, match="negatif"):
+        buat_graf([4, 4, 2, 2], metode=metode, seed=0, **opsi)
+
+
+@pytest.mark.parametrize("maks_ganda", [None, 3])
+def test_syarat_tepat_menolak_batas_paralel_selain_1_atau_2(maks_ganda):
+    with pytest.raises(ValueError, match="syarat_tepat"):
+        buat_graf([4, 4, 2, 2], metode="syarat_tepat", seed=0, maks_ganda=maks_ganda)
+
+
+@pytest.mark.parametrize("derajat", [[3, 3, 2, 2, 2], [2, 2, 2, 2], [1, 1, 0]])
+def test_syarat_tepat_graf_sederhana_tanpa_loop(derajat):
+    graf = buat_graf(derajat, metode="syarat_tepat", seed=0, maks_ganda=1, izinkan_loop=False)
+    _periksa_realisasi(np.column_stack([graf.u, graf.v]), derajat, 1, False, 0, 0)
+
+
+def test_cli_menolak_jumlah_syarat_negatif(tmp_path, capsys):
+    berkas = tmp_path / "derajat.txt"
+    berkas.write_text("4 4 2 2")
+    with pytest.raises(SystemExit):
+        main(["--derajat", str(berkas), "--metode", "syarat", "--jumlah-loop", "-1"])
+    assert "--jumlah-loop" in capsys.readouterr().err
+
+
+@pytest.mark.parametrize("sisi", [[], [[4, 4], [5, 5]], [[0, 1]]])
+def test_tata_letak_spektral_tanpa_sisi_biasa(sisi):
+    pytest.importorskip("scipy")
+    graf = GrafKompak(6)
+    graf.tambah_sisi_banyak(np.array(sisi, dtype=np.int32).reshape(-1, 2))
+    pos = tata_letak(graf, "spektral", seed=0)
+    assert pos.shape == (6, 2) and np.isfinite(pos).all()
+
+
+def test_tata_letak_spektral_tanpa_scipy(monkeypatch):
+    monkeypatch.setitem(sys.modules, "scipy.sparse", None)
+    pos = tata_letak(_graf_cincin(10), "spektral", seed=0)
+    assert pos.shape == (10, 2) and np.isfinite(pos).all()
+
+
+@pytest.mark.parametrize("derajat, maks_ganda, izinkan_loop, jumlah_graf", [
+    ([2, 2], 2, True, 2),
+    ([2, 2, 2], 2, True, 5),
+    ([2, 2, 2, 2], None, False, 6),
+    ([3, 3, 2, 2], 2, True, 23),
+])
+def test_tukar_sisi_seragam_atas_multigraf(derajat, maks_ganda, izinkan_loop, jumlah_graf):
+    awal = buat_graf(derajat, metode="mcmc", seed=0, maks_ganda=maks_ganda, izinkan_loop=izinkan_loop)
+    hitung = collections.Counter(
+        tuple(sorted(map(tuple, np.sort(graf.sisi(), axis=1).tolist())))
+        for graf in sampel_tukar_sisi(awal, 8000, jarak=3, seed=1, maks_ganda=maks_ganda, izinkan_loop=izinkan_loop))
+    assert len(hitung) == jumlah_graf
+    assert max(abs(c / 8000 - 1 / jumlah_graf) for c in hitung.values()) < 0.02
+
+
+def test_syarat_tepat_menolak_struktur_derajat_mustahil():
+    with pytest.raises(ValueError, match="simpul berderajat terbesar"):
+        buat_graf([2] * 17 + [32], metode="syarat_tepat", seed=0)
+    with pytest.raises(ValueError, match="simpul berderajat terbesar"):
+        buat_graf([40] + [2] * 30, metode="syarat_tepat", jumlah_loop=2, jumlah_ganda=3, seed=0)
+
+
+def test_syarat_tepat_diperbaiki_tukar_sisi_di_atas_batas_menyeluruh():
+    derajat = [7, 1, 5, 3, 10, 1, 4, 3, 3, 0, 2, 5, 10, 5, 6, 2, 1, 2, 4, 5, 1]
+    for seed in range(20):
+        graf = buat_graf(derajat, metode="syarat_tepat", jumlah_loop=1, jumlah_ganda=3, seed=seed)
+        _periksa_realisasi(graf.sisi(), derajat, 2, True, 1, 3)
+
+
+def test_syarat_tepat_barisan_acak_tidak_pernah_tak_pasti():
+    rng = np.random.default_rng(3)
+    for seed in range(300):
+        derajat = rng.integers(0, int(rng.integers(2, 12)), int(rng.integers(17, 40)))
+        if derajat.sum() % 2:
+            derajat[0] += 1
+        jumlah_loop = int(rng.integers(0, derajat.sum() // 2 + 1))
+        jumlah_ganda = int(rng.integers(0, derajat.sum() // 4 + 1))
+        try:
+            graf = buat_graf(derajat, metode="syarat_tepat", jumlah_loop=jumlah_loop, jumlah_ganda=jumlah_ganda,
+                             seed=seed)
+        except ValueError as e:
+            assert "tidak dapat dipastikan" not in str(e)
+            continue
+        _periksa_realisasi(graf.sisi(), derajat, 2, True, jumlah_loop, jumlah_ganda)
+
+
+@pytest.mark.parametrize("teks, derajat, jumlah", [
+    ("1000x3 500x4", [3, 4], [1000, 500]),
+    ("0x5 2", [2], [1]),
+    ("3,3\n2;1\t1", [3, 2, 1], [2, 1, 2]),
+    ("2X3\r\n5, 2x3", [3, 5, 3], [2, 1, 2]),
+    ("", [], []),
+    ("9" * 18, [10 ** 18 - 1], [1]),
+])
+def test_urai_histogram(teks, derajat, jumlah):
+    histogram = urai_histogram(teks)
+    assert histogram.derajat.tolist() == derajat
+    assert histogram.jumlah.tolist() == jumlah
+    assert urai_histogram(teks.encode()).barisan().tolist() == np.repeat(derajat, jumlah).tolist()
+
+
+@pytest.mark.parametrize("teks, pesan", [
+    ("x3", "JUMLAHxDERAJAT"),
+    ("3x", "JUMLAHxDERAJAT"),
+    ("3 x 4", "JUMLAHxDERAJAT"),
+    ("1x2x3", "satu 'x'"),
+    ("1" * 19, "terlalu besar"),
+    ("3 a", "'a' pada posisi 3"),
+])
+def test_urai_histogram_menolak_format_salah(teks, pesan):
+    with pytest.raises(ValueError, match=pesan):
+        urai_histogram(teks)
+
+
+def _graf_cincin(n, tambahan=()):
+    graf = GrafKompak(n)
+    graf.tambah_sisi_banyak([(i, (i + 1) % n) for i in range(n)] + list(tambahan))
+    return graf
+
+
+def test_cache_tata_letak_mengembalikan_hasil_tersimpan(monkeypatch):
+    cache = CacheTataLetak()
+    graf = _graf_cincin(30)
+    pos = tata_letak(graf, "gaya", seed=0, cache=cache)
+    asli = pos.copy()
+    pos[1] = -99.0
+    monkeypatch.setitem(METODE_TATA_LETAK, "gaya", lambda *a, **k: pytest.fail("tata letak dihitung ulang"))
+    ulang = tata_letak(_graf_cincin(30), "gaya", seed=5, cache=cache)
+    assert np.array_equal(asli, ulang)
+    ulang[0] = 99.0
+    assert np.array_equal(asli, tata_letak(graf, "gaya", cache=cache))
+
+
+def test_cache_tata_letak_pulang_pergi_disk(tmp_path, monkeypatch):
+    graf = _graf_cincin(30)
+    pos = tata_letak(graf, "gaya", seed=0, cache=CacheTataLetak(direktori=str(tmp_path)))
+    assert len(list(tmp_path.glob("*.npz"))) == 1
+    monkeypatch.setitem(METODE_TATA_LETAK, "gaya", lambda *a, **k: pytest.fail("tata letak dihitung ulang"))
+    assert np.array_equal(pos, tata_letak(graf, "gaya", cache=CacheTataLetak(direktori=str(tmp_path))))
+
+
+def test_cache_tata_letak_memulai_hangat_dari_graf_mirip(monkeypatch):
+    cache = CacheTataLetak()
+    pos = tata_letak(_graf_cincin(30), "gaya", seed=0, cache=cache)
+    awal = {}
+    asli = METODE_TATA_LETAK["gaya"]
+
+    def rekam(n, a, b, bobot, rng, posisi_awal=None, **opsi):
+        awal["posisi"] = posisi_awal
+        return asli(n, a, b, bobot, rng, posisi_awal=posisi_awal, **opsi)
+
+    monkeypatch.setitem(METODE_TATA_LETAK, "gaya", rekam)
+    tata_letak(_graf_cincin(31, [(0, 15)]), "gaya", seed=0, cache=cache)
+    assert np.array_equal(awal["posisi"][:30], pos)
+    assert np.isfinite(awal["posisi"]).all()
+
+    tata_letak(GrafKompak(30), "gaya", seed=0, cache=cache)
+    assert awal["posisi"] is None
+
+
+@pytest.mark.parametrize("antialias", [False, True])
+def test_rasterkan_sisi_menjaga_total_kepadatan(antialias):
+    rng = np.random.default_rng(2)
+    posisi = rng.uniform(-1, 1, (200, 2))
+    eu, ev = rng.integers(0, 200, 3000), rng.integers(0, 200, 3000)
+    px = (posisi - posisi.min(axis=0)) / (posisi.max(axis=0) - posisi.min(axis=0)) * 255
+    panjang = np.ceil(np.abs(px[eu] - px[ev]).max(axis=1)) + 1
+
+    penuh = rasterkan_sisi(posisi, eu, ev, lebar=256, antialias=antialias)
+    hemat = rasterkan_sisi(posisi, eu, ev, lebar=256, antialias=antialias, anggaran_sampel=int(panjang.sum()) // 4)
+    assert penuh.shape == hemat.shape == (256, 256)
+    assert penuh.sum() == pytest.approx(panjang.sum())
+    assert hemat.sum() == pytest.approx(panjang.sum(), rel=1e-4)
+    assert (hemat >= 0).all()
+
+
+def _puncak_memori_aliran(derajat):
+    tracemalloc.start()
+    try:
+        jumlah = sum(1 for _ in alirkan_sisi(derajat, seed=0))
+        return jumlah, tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def test_aliran_memori_tidak_tumbuh_dengan_jumlah_sisi():
+    _, puncak_kecil = _puncak_memori_aliran(np.full(2000, 10))
+    jumlah, puncak_besar = _puncak_memori_aliran(np.full(2000, 300))
+    assert jumlah == 300000
+    assert puncak_besar < 8 * jumlah
+    assert puncak_besar - puncak_kecil < 500_000
+
+
+@pytest.mark.parametrize("maks_ganda", [1, 2, None])
+@pytest.mark.parametrize("izinkan_loop", [False, True])
+def test_aliran_per_simpul_tanpa_ekor_besar(maks_ganda, izinkan_loop):
+    kasus = [np.full(300, 298), [5000] + [2] * 2500, np.r_[np.full(100, 150), np.full(2000, 3)]]
+    rng = np.random.default_rng(17)
+    for _ in range(300):
+        derajat = rng.integers(0, int(rng.integers(1, 30)), int(rng.integers(2, 30)))
+        if derajat.sum() % 2:
+            derajat[0] += 1
+        kasus.append(derajat)
+    for seed, derajat in enumerate(kasus):
+        derajat = np.asarray(derajat)
+        if alasan_tidak_grafis(derajat, maks_ganda=maks_ganda, izinkan_loop=izinkan_loop) is not None:
+            continue
+        sisi = np.array(list(alirkan_sisi(derajat, seed=seed, maks_ganda=maks_ganda, izinkan_loop=izinkan_loop,
+                                          ukuran_ekor=2)), dtype=np.int64).reshape(-1, 2)
+        _periksa_realisasi(sisi, derajat, maks_ganda, izinkan_loop)
+
+
+@pytest.mark.parametrize("format, kepala", [("png", b"\x89PNG"), ("svg", b"<?xml"), ("pdf", b"%PDF")])
+def test_render_graf_menulis_berkas_tanpa_layar(tmp_path, format, kepala):
+    pytest.importorskip("matplotlib")
+    berkas = tmp_path / f"graf.{format}"
+    assert render_graf(_graf_cincin(12, [(0, 0), (1, 2)]), berkas, seed=0, ukuran=(3, 3), dpi=50) == berkas
+    assert berkas.read_bytes().startswith(kepala)
+
+
+def test_render_pekerja_memakai_ulang_satu_figur(tmp_path, monkeypatch):
+    pytest.importorskip("matplotlib")
+    monkeypatch.setattr(terminologi_graph, "_FIGUR_PEKERJA", None)
+    berkas = [tmp_path / f"graf_{i}.png" for i in range(3)]
+    figur = []
+    for i, nama in enumerate(berkas):
+        terminologi_graph._render_pekerja(_graf_cincin(8 + i), nama, i, {"ukuran": (3, 3), "dpi": 50})
+        figur.append(terminologi_graph._FIGUR_PEKERJA)
+        assert not figur[-1].axes
+    assert figur[0] is figur[1] is figur[2]
+    assert all(nama.stat().st_size for nama in berkas)
+
+
+def test_cli_gambar_banyak_menomori_keluaran(tmp_path):
+    pytest.importorskip("matplotlib")
+    derajat = [4, 3, 3, 2, 2, 2]
+    berkas = tmp_path / "derajat.txt"
+    berkas.write_text(" ".join(map(str, derajat)))
+    assert main(["--derajat", str(berkas), "--gambar", str(tmp_path / "g.png"), "--jumlah", "3",
+                 "-o", str(tmp_path / "s.txt"), "--pekerja", "1", "--seed", "0"]) == 0
+    for i in range(3):
+        assert (tmp_path / f"g_{i}.png").stat().st_size
+        _periksa_realisasi(np.loadtxt(tmp_path / f"s_{i}.txt", dtype=np.int64) - 1, derajat, 2, True)
+    assert sorted(p.name for p in tmp_path.iterdir()) == \
+        ["derajat.txt"] + [f"g_{i}.png" for i in range(3)] + [f"s_{i}.txt" for i in range(3)]
+
+
+def _sumbu_agg():
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    figur = Figure(figsize=(4, 4), dpi=50)
+    FigureCanvasAgg(figur)
+    return figur.add_subplot()
+
+
+@pytest.mark.parametrize("n", [0, 1])
+def test_penampil_graf_kecil(n):
+    pytest.importorskip("matplotlib")
+    penampil = PenampilGraf(GrafKompak(n), seed=0)
+    penampil.pasang(_sumbu_agg())
+    assert penampil._kunci_tampilan[0] == "detail"
+    penampil.figur.canvas.draw()
+
+
+def test_penampil_graf_beralih_ke_detail_dan_memakai_ulang_ubin():
+    pytest.importorskip("matplotlib")
+    sisi_grid = 40
+    indeks = np.arange(sisi_grid * sisi_grid).reshape(sisi_grid, sisi_grid)
+    graf = GrafKompak(indeks.size)
+    graf.tambah_sisi_banyak(np.concatenate([np.column_stack((indeks[:, :-1].ravel(), indeks[:, 1:].ravel())),
+                                            np.column_stack((indeks[:-1].ravel(), indeks[1:].ravel()))]))
+    posisi = np.column_stack(np.divmod(indeks.ravel(), sisi_grid)).astype(float)
+    penampil = PenampilGraf(graf, posisi, batas_detail=500)
+    ax = _sumbu_agg()
+    penampil.pasang(ax)
+    assert penampil._kunci_tampilan[0] == "agregat" and penampil._raster is not None
+
+    ax.set_xlim(10, 16)
+    ax.set_ylim(10, 16)
+    assert penampil.perbarui()
+    assert penampil._kunci_tampilan[0] == "detail" and penampil._raster is None
+    ubin = dict(penampil._ubin)
+
+    ax.set_xlim(12, 18)
+    ax.set_ylim(12, 18)
+    penampil.perbarui()
+    tetap = set(ubin) & set(penampil._ubin)
+    assert tetap and set(penampil._ubin) != set(ubin)
+    assert all(penampil._ubin[c] is ubin[c] for c in tetap)
+
+
+def test_impor_tidak_memuat_pustaka_berat():
+    kode = "import sys, terminologi_graph; print(sorted({'networkx', 'matplotlib', 'scipy'} & set(sys.modules)))"
+    hasil = subprocess.run([sys.executable, "-c", kode], capture_output=True, text=True, check=True,
+                           cwd=os.path.dirname(os.path.abspath(terminologi_graph.__file__)))
+    assert hasil.stdout.strip() == "[]"